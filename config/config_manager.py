@@ -25,17 +25,226 @@ import json
 import os
 import sys
 import shutil
+import tempfile
+import time
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List, Tuple
-import jsonschema
-from jsonschema import ValidationError
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+
+# orjson parses straight from bytes and is several times faster than the
+# stdlib json module; fall back transparently when it is not installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception either way.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+# Optional streaming parser used by validate_config_file
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+# Schema "pattern" keywords are matched with RE2 when google-re2 is installed:
+# its linear-time DFA cannot backtrack pathologically on hostile input.
+try:
+    import re2 as _pattern_engine  # type: ignore
+except ImportError:
+    import re as _pattern_engine
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str):
+    """Compile a schema pattern once per process"""
+    return _pattern_engine.compile(pattern)
+
+
+def _pattern_keyword(validator, pattern, instance, schema):
+    """jsonschema "pattern" keyword backed by precompiled patterns"""
+    if validator.is_type(instance, "string") and not _compile_pattern(pattern).search(instance):
+        from jsonschema import ValidationError
+        yield ValidationError(f"{instance!r} does not match {pattern!r}")
+
+
+def _compile_fast_check(schema: Dict[str, Any]):
+    """Compile schema into a bool predicate with fastjsonschema, if installed
+    
+    fastjsonschema generates straight-line Python per schema, which is much
+    faster than jsonschema's generic walk but reports only the first error,
+    so it backs is_config_valid while validate_config keeps jsonschema.
+    """
+    try:
+        import fastjsonschema  # type: ignore
+    except ImportError:
+        return None
+    compiled = fastjsonschema.compile(schema, use_default=False, detailed_exceptions=False)
+    
+    def check(instance: Any) -> bool:
+        try:
+            compiled(instance)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+    
+    return check
+
+def _freeze_schema(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_schema(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_schema(item) for item in value)
+    return value
+
+# Schema definitions for validation. Validators are built once per process (see
+# _schema_validators) so schema checking and pattern compilation are not
+# repeated per instance or call.
+_AWS_SCHEMA_DEFINITION = {
+    "type": "object",
+    "properties": {
+        "aws": {
+            "type": "object",
+            "properties": {
+                "region": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+                "profile": {"type": "string"},
+                "credentials_file": {"type": "string"}
+            },
+            "required": ["region", "profile"]
+        },
+        "s3": {
+            "type": "object",
+            "properties": {
+                "bucket_name": {"type": "string", "pattern": "^[a-z0-9.-]+$"},
+                "sync_path": {"type": "string"},
+                "storage_class": {
+                    "type": "string",
+                    "enum": ["STANDARD", "STANDARD_IA", "ONEZONE_IA", "INTELLIGENT_TIERING", "GLACIER", "DEEP_ARCHIVE"]
+                },
+                "encryption": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {"type": "boolean"},
+                        "algorithm": {"type": "string", "enum": ["AES256", "aws:kms"]}
+                    },
+                    "required": ["enabled"]
+                },
+                "versioning": {
+                    "type": "object",
+                    "properties": {
+                        "enabled": {"type": "boolean"}
+                    },
+                    "required": ["enabled"]
+                }
+            },
+            "required": ["bucket_name", "storage_class", "encryption", "versioning"]
+        },
+        "sync": {
+            "type": "object",
+            "properties": {
+                "local_path": {"type": "string"},
+                "exclude_patterns": {"type": "array", "items": {"type": "string"}},
+                "include_patterns": {"type": "array", "items": {"type": "string"}},
+                "max_concurrent_uploads": {"type": "integer", "minimum": 1, "maximum": 50},
+                "chunk_size_mb": {"type": "integer", "minimum": 1, "maximum": 5000},
+                "retry_attempts": {"type": "integer", "minimum": 0, "maximum": 10},
+                "dry_run": {"type": "boolean"}
+            },
+            "required": ["local_path", "exclude_patterns", "include_patterns"]
+        }
+    },
+    "required": ["aws", "s3", "sync"]
+}
+
+_SYNC_SCHEMA_DEFINITION = {
+    "type": "object",
+    "properties": {
+        "sync_settings": {
+            "type": "object",
+            "properties": {
+                "mode": {"type": "string", "enum": ["incremental", "full", "mirror"]},
+                "dry_run": {"type": "boolean"},
+                "force_sync": {"type": "boolean"},
+                "delete_remote": {"type": "boolean"},
+                "preserve_timestamps": {"type": "boolean"},
+                "verify_checksums": {"type": "boolean"}
+            },
+            "required": ["mode", "dry_run", "force_sync", "delete_remote"]
+        },
+        "file_handling": {
+            "type": "object",
+            "properties": {
+                "max_file_size": {"type": "integer", "minimum": 1},
+                "chunk_size": {"type": "integer", "minimum": 1024},
+                "concurrent_uploads": {"type": "integer", "minimum": 1, "maximum": 20},
+                "timeout": {"type": "integer", "minimum": 30},
+                "retry_attempts": {"type": "integer", "minimum": 0, "maximum": 10},
+                "retry_delay": {"type": "integer", "minimum": 1}
+            },
+            "required": ["max_file_size", "chunk_size", "concurrent_uploads", "timeout"]
+        },
+        "filters": {
+            "type": "object",
+            "properties": {
+                "include_extensions": {"type": "array", "items": {"type": "string"}},
+                "exclude_extensions": {"type": "array", "items": {"type": "string"}},
+                "exclude_directories": {"type": "array", "items": {"type": "string"}},
+                "exclude_files": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["include_extensions", "exclude_extensions", "exclude_directories", "exclude_files"]
+        }
+    },
+    "required": ["sync_settings", "file_handling", "filters"]
+}
+
+# The schemas are shared by every ConfigManager, so only read-only views are
+# exposed (check_schema and fastjsonschema need the plain definitions)
+AWS_SCHEMA = _freeze_schema(_AWS_SCHEMA_DEFINITION)
+SYNC_SCHEMA = _freeze_schema(_SYNC_SCHEMA_DEFINITION)
+
+@lru_cache(maxsize=None)
+def _schema_validators() -> Dict[str, Any]:
+    """Build the schema validators on first use
+    
+    jsonschema is imported here rather than at module load, so read-only
+    uses of ConfigManager (loading, info, backups) never pay for it.
+    """
+    from jsonschema import Draft7Validator, validators
+    
+    config_validator = validators.extend(Draft7Validator, {"pattern": _pattern_keyword})
+    config_validator.check_schema(_AWS_SCHEMA_DEFINITION)
+    config_validator.check_schema(_SYNC_SCHEMA_DEFINITION)
+    aws_validator = config_validator(AWS_SCHEMA)
+    sync_validator = config_validator(SYNC_SCHEMA)
+    
+    return {
+        "aws": aws_validator,
+        "sync": sync_validator,
+        "aws_is_valid": _compile_fast_check(_AWS_SCHEMA_DEFINITION) or aws_validator.is_valid,
+        "sync_is_valid": _compile_fast_check(_SYNC_SCHEMA_DEFINITION) or sync_validator.is_valid,
+        # Per-section validators for streaming validation of top-level keys
+        "aws_sections": {key: config_validator(sub) for key, sub in AWS_SCHEMA["properties"].items()},
+        "sync_sections": {key: config_validator(sub) for key, sub in SYNC_SCHEMA["properties"].items()},
+    }
 
 class ConfigManager:
     """Comprehensive configuration manager for sync operations"""
     
+    # How long a successful STS identity check is trusted before re-checking
+    IDENTITY_CACHE_TTL_SECONDS = 300
+    
     def __init__(self, config_dir: str = "config"):
         """Initialize configuration manager"""
         self.config_dir = Path(config_dir)
@@ -52,105 +261,24 @@ class ConfigManager:
         
         # Schema definitions for validation
         self._load_schemas()
+        
+        # Monotonic time of the last successful get_caller_identity call
+        self._identity_checked_at: Optional[float] = None
     
     def _load_schemas(self):
         """Load JSON schemas for configuration validation"""
-        self.aws_schema = {
-            "type": "object",
-            "properties": {
-                "aws": {
-                    "type": "object",
-                    "properties": {
-                        "region": {"type": "string", "pattern": "^[a-z0-9-]+$"},
-                        "profile": {"type": "string"},
-                        "credentials_file": {"type": "string"}
-                    },
-                    "required": ["region", "profile"]
-                },
-                "s3": {
-                    "type": "object",
-                    "properties": {
-                        "bucket_name": {"type": "string", "pattern": "^[a-z0-9.-]+$"},
-                        "sync_path": {"type": "string"},
-                        "storage_class": {
-                            "type": "string",
-                            "enum": ["STANDARD", "STANDARD_IA", "ONEZONE_IA", "INTELLIGENT_TIERING", "GLACIER", "DEEP_ARCHIVE"]
-                        },
-                        "encryption": {
-                            "type": "object",
-                            "properties": {
-                                "enabled": {"type": "boolean"},
-                                "algorithm": {"type": "string", "enum": ["AES256", "aws:kms"]}
-                            },
-                            "required": ["enabled"]
-                        },
-                        "versioning": {
-                            "type": "object",
-                            "properties": {
-                                "enabled": {"type": "boolean"}
-                            },
-                            "required": ["enabled"]
-                        }
-                    },
-                    "required": ["bucket_name", "storage_class", "encryption", "versioning"]
-                },
-                "sync": {
-                    "type": "object",
-                    "properties": {
-                        "local_path": {"type": "string"},
-                        "exclude_patterns": {"type": "array", "items": {"type": "string"}},
-                        "include_patterns": {"type": "array", "items": {"type": "string"}},
-                        "max_concurrent_uploads": {"type": "integer", "minimum": 1, "maximum": 50},
-                        "chunk_size_mb": {"type": "integer", "minimum": 1, "maximum": 5000},
-                        "retry_attempts": {"type": "integer", "minimum": 0, "maximum": 10},
-                        "dry_run": {"type": "boolean"}
-                    },
-                    "required": ["local_path", "exclude_patterns", "include_patterns"]
-                }
-            },
-            "required": ["aws", "s3", "sync"]
-        }
-        
-        self.sync_schema = {
-            "type": "object",
-            "properties": {
-                "sync_settings": {
-                    "type": "object",
-                    "properties": {
-                        "mode": {"type": "string", "enum": ["incremental", "full", "mirror"]},
-                        "dry_run": {"type": "boolean"},
-                        "force_sync": {"type": "boolean"},
-                        "delete_remote": {"type": "boolean"},
-                        "preserve_timestamps": {"type": "boolean"},
-                        "verify_checksums": {"type": "boolean"}
-                    },
-                    "required": ["mode", "dry_run", "force_sync", "delete_remote"]
-                },
-                "file_handling": {
-                    "type": "object",
-                    "properties": {
-                        "max_file_size": {"type": "integer", "minimum": 1},
-                        "chunk_size": {"type": "integer", "minimum": 1024},
-                        "concurrent_uploads": {"type": "integer", "minimum": 1, "maximum": 20},
-                        "timeout": {"type": "integer", "minimum": 30},
-                        "retry_attempts": {"type": "integer", "minimum": 0, "maximum": 10},
-                        "retry_delay": {"type": "integer", "minimum": 1}
-                    },
-                    "required": ["max_file_size", "chunk_size", "concurrent_uploads", "timeout"]
-                },
-                "filters": {
-                    "type": "object",
-                    "properties": {
-                        "include_extensions": {"type": "array", "items": {"type": "string"}},
-                        "exclude_extensions": {"type": "array", "items": {"type": "string"}},
-                        "exclude_directories": {"type": "array", "items": {"type": "string"}},
-                        "exclude_files": {"type": "array", "items": {"type": "string"}}
-                    },
-                    "required": ["include_extensions", "exclude_extensions", "exclude_directories", "exclude_files"]
-                }
-            },
-            "required": ["sync_settings", "file_handling", "filters"]
-        }
+        self.aws_schema = AWS_SCHEMA
+        self.sync_schema = SYNC_SCHEMA
+    
+    @property
+    def _aws_validator(self):
+        """Shared validator for the AWS config schema"""
+        return _schema_validators()["aws"]
+    
+    @property
+    def _sync_validator(self):
+        """Shared validator for the sync config schema"""
+        return _schema_validators()["sync"]
     
     def load_config(self, config_type: str = "all") -> Dict[str, Any]:
         """Load configuration files
@@ -164,24 +292,20 @@ class ConfigManager:
         config = {}
         
         if config_type in ["aws", "all"]:
-            if self.aws_config_path.exists():
-                try:
-                    with open(self.aws_config_path, 'r') as f:
-                        config["aws"] = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    raise ConfigError(f"Failed to load AWS config: {e}")
-            else:
+            try:
+                config["aws"] = _read_config_file(self.aws_config_path)
+            except FileNotFoundError:
                 raise ConfigError(f"AWS config file not found: {self.aws_config_path}")
+            except (json.JSONDecodeError, IOError) as e:
+                raise ConfigError(f"Failed to load AWS config: {e}")
         
         if config_type in ["sync", "all"]:
-            if self.sync_config_path.exists():
-                try:
-                    with open(self.sync_config_path, 'r') as f:
-                        config["sync"] = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    raise ConfigError(f"Failed to load sync config: {e}")
-            else:
+            try:
+                config["sync"] = _read_config_file(self.sync_config_path)
+            except FileNotFoundError:
                 raise ConfigError(f"Sync config file not found: {self.sync_config_path}")
+            except (json.JSONDecodeError, IOError) as e:
+                raise ConfigError(f"Failed to load sync config: {e}")
         
         return config
     
@@ -192,22 +316,25 @@ class ConfigManager:
             config: Configuration dictionary
             config_type: "aws", "sync", or "all"
         """
+        pending = []
+        if config_type in ["aws", "all"] and "aws" in config:
+            pending.append((self.aws_config_path, _json_dumps(config["aws"]), "AWS"))
+        if config_type in ["sync", "all"] and "sync" in config:
+            pending.append((self.sync_config_path, _json_dumps(config["sync"]), "sync"))
+        
+        # Files already holding exactly these bytes need neither backup nor write
+        changed = [entry for entry in pending if not self._file_has_content(entry[0], entry[1])]
+        if not changed:
+            return
+        
         # Create backup before saving
         self._create_backup()
         
-        if config_type in ["aws", "all"] and "aws" in config:
-            try:
-                with open(self.aws_config_path, 'w') as f:
-                    json.dump(config["aws"], f, indent=2)
-            except IOError as e:
-                raise ConfigError(f"Failed to save AWS config: {e}")
-        
-        if config_type in ["sync", "all"] and "sync" in config:
+        for path, data, name in changed:
             try:
-                with open(self.sync_config_path, 'w') as f:
-                    json.dump(config["sync"], f, indent=2)
+                self._replace_file(path, data)
             except IOError as e:
-                raise ConfigError(f"Failed to save sync config: {e}")
+                raise ConfigError(f"Failed to save {name} config: {e}")
     
     def validate_config(self, config: Dict[str, Any], config_type: str = "all") -> List[str]:
         """Validate configuration against schemas
@@ -222,19 +349,93 @@ class ConfigManager:
         errors = []
         
         if config_type in ["aws", "all"] and "aws" in config:
-            try:
-                jsonschema.validate(config["aws"], self.aws_schema)
-            except ValidationError as e:
+            for e in self._aws_validator.iter_errors(config["aws"]):
                 errors.append(f"AWS config validation error: {e.message}")
         
         if config_type in ["sync", "all"] and "sync" in config:
-            try:
-                jsonschema.validate(config["sync"], self.sync_schema)
-            except ValidationError as e:
+            for e in self._sync_validator.iter_errors(config["sync"]):
                 errors.append(f"Sync config validation error: {e.message}")
         
         return errors
     
+    def is_config_valid(self, config: Dict[str, Any], config_type: str = "all") -> bool:
+        """Check configuration against schemas without collecting errors
+        
+        Stops at the first violation, so it is cheaper than validate_config
+        when only a yes/no answer is needed.
+        
+        Args:
+            config: Configuration dictionary
+            config_type: "aws", "sync", or "all"
+            
+        Returns:
+            True if the configuration is valid
+        """
+        if config_type in ["aws", "all"] and "aws" in config:
+            if not _schema_validators()["aws_is_valid"](config["aws"]):
+                return False
+        
+        if config_type in ["sync", "all"] and "sync" in config:
+            if not _schema_validators()["sync_is_valid"](config["sync"]):
+                return False
+        
+        return True
+    
+    def validate_config_file(self, config_type: str = "all") -> List[str]:
+        """Validate configuration files on disk
+        
+        With ijson installed, each top-level section is parsed and validated
+        on its own, so peak memory is bounded by the largest section rather
+        than the whole file. Without it this is load_config + validate_config.
+        
+        Args:
+            config_type: "aws", "sync", or "all"
+            
+        Returns:
+            List of validation errors (empty if valid)
+        """
+        if ijson is None:
+            return self.validate_config(self.load_config(config_type), config_type)
+        
+        errors = []
+        
+        if config_type in ["aws", "all"]:
+            errors.extend(self._stream_validate_file(
+                self.aws_config_path, AWS_SCHEMA, _schema_validators()["aws_sections"], "AWS", "AWS"))
+        
+        if config_type in ["sync", "all"]:
+            errors.extend(self._stream_validate_file(
+                self.sync_config_path, SYNC_SCHEMA, _schema_validators()["sync_sections"], "sync", "Sync"))
+        
+        return errors
+    
+    def _stream_validate_file(self, path: Path, schema: Dict[str, Any],
+                              section_validators: Dict[str, Any],
+                              name: str, label: str) -> List[str]:
+        """Validate one config file section by section with ijson"""
+        if not path.exists():
+            raise ConfigError(f"{label} config file not found: {path}")
+        
+        errors = []
+        seen = set()
+        try:
+            with open(path, 'rb') as f:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    seen.add(key)
+                    validator = section_validators.get(key)
+                    if validator is None:
+                        continue
+                    for e in validator.iter_errors(value):
+                        errors.append(f"{label} config validation error: {e.message}")
+        except (ijson.JSONError, IOError) as e:
+            raise ConfigError(f"Failed to load {name} config: {e}")
+        
+        for key in schema.get("required", []):
+            if key not in seen:
+                errors.append(f"{label} config validation error: {key!r} is a required property")
+        
+        return errors
+    
     def create_environment_config(self, environment: str, base_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create environment-specific configuration
         
@@ -297,17 +498,58 @@ class ConfigManager:
         return migrated_config
     
     def _create_backup(self) -> None:
-        """Create backup of current configuration"""
+        """Create backup of current configuration
+        
+        Backups are independent copies: a hardlink would share its inode with
+        the live file and change along with it whenever a tool (setup
+        scripts, editors) rewrites the file in place. A file whose content
+        equals its newest backup is unchanged since then and is skipped.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         for config_file in [self.aws_config_path, self.sync_config_path]:
-            if config_file.exists():
-                backup_path = self.backup_dir / f"{config_file.stem}_{timestamp}.json"
-                shutil.copy2(config_file, backup_path)
+            try:
+                current = config_file.read_bytes()
+            except FileNotFoundError:
+                continue
+            
+            existing = sorted(self.backup_dir.glob(f"{config_file.stem}_*.json"))
+            if existing and self._file_has_content(existing[-1], current):
+                continue
+            
+            backup_path = self.backup_dir / f"{config_file.stem}_{timestamp}.json"
+            shutil.copy2(config_file, backup_path)
+    
+    def _file_has_content(self, path: Path, data: bytes) -> bool:
+        """Check whether path exists and holds exactly data"""
+        try:
+            if os.stat(path).st_size != len(data):
+                return False
+            return path.read_bytes() == data
+        except FileNotFoundError:
+            return False
+    
+    def _replace_file(self, path: Path, data: bytes) -> None:
+        """Write data to a new file, fsync it and atomically rename it over path"""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            if path.exists():
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
     
     def _deep_copy_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Create deep copy of configuration dictionary"""
-        return json.loads(json.dumps(config))
+        return _clone_config_value(config)
     
     def get_config_info(self) -> Dict[str, Any]:
         """Get information about current configuration files"""
@@ -318,24 +560,28 @@ class ConfigManager:
         }
         
         for config_file in [self.aws_config_path, self.sync_config_path]:
-            if config_file.exists():
-                stat = config_file.stat()
-                info["files"][config_file.name] = {
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "exists": True
-                }
-            else:
+            try:
+                stat = os.stat(config_file)
+            except FileNotFoundError:
                 info["files"][config_file.name] = {"exists": False}
-        
-        # List backup files
-        for backup_file in self.backup_dir.glob("*.json"):
-            stat = backup_file.stat()
-            info["backups"].append({
-                "name": backup_file.name,
+                continue
+            info["files"][config_file.name] = {
                 "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat()
-            })
+                "modified": _format_timestamp(stat.st_mtime),
+                "exists": True
+            }
+        
+        # List backup files (scandir entries cache their stat result)
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                info["backups"].append({
+                    "name": entry.name,
+                    "size": stat.st_size,
+                    "created": _format_timestamp(stat.st_ctime)
+                })
         
         return info
     
@@ -353,14 +599,17 @@ class ConfigManager:
             return False
         
         try:
+            # Read first: a same-second backup below may reuse this name
+            backup_data = backup_path.read_bytes()
+            
             # Create current backup before restoring
             self._create_backup()
             
             # Determine which config file to restore
             if "aws-config" in backup_name:
-                shutil.copy2(backup_path, self.aws_config_path)
+                self._replace_file(self.aws_config_path, backup_data)
             elif "sync-config" in backup_name:
-                shutil.copy2(backup_path, self.sync_config_path)
+                self._replace_file(self.sync_config_path, backup_data)
             else:
                 return False
             
@@ -368,19 +617,42 @@ class ConfigManager:
         except Exception:
             return False
     
+    @cached_property
+    def _session(self):
+        """Shared boto3 session, created on first use"""
+        import boto3
+        return boto3.Session()
+    
+    @cached_property
+    def _sts_client(self):
+        """Shared STS client, created on first use"""
+        return self._session.client('sts')
+    
+    @cached_property
+    def _s3_client(self):
+        """Shared S3 client, created on first use"""
+        return self._session.client('s3')
+    
     def validate_aws_credentials(self) -> List[str]:
         """Validate AWS credentials and permissions
         
+        A successful identity check is reused for IDENTITY_CACHE_TTL_SECONDS
+        so repeated validation does not round-trip to STS every time.
+        
         Returns:
             List of validation errors (empty if valid)
         """
+        from botocore.exceptions import ClientError, NoCredentialsError
+        
         errors = []
         
         try:
             # Test AWS credentials
-            session = boto3.Session()
-            sts = session.client('sts')
-            sts.get_caller_identity()
+            now = time.monotonic()
+            if (self._identity_checked_at is None
+                    or now - self._identity_checked_at > self.IDENTITY_CACHE_TTL_SECONDS):
+                self._sts_client.get_caller_identity()
+                self._identity_checked_at = now
         except NoCredentialsError:
             errors.append("AWS credentials not found")
         except ClientError as e:
@@ -390,8 +662,7 @@ class ConfigManager:
         try:
             config = self.load_config("aws")
             bucket_name = config["aws"]["s3"]["bucket_name"]
-            s3 = session.client('s3')
-            s3.head_bucket(Bucket=bucket_name)
+            self._s3_client.head_bucket(Bucket=bucket_name)
         except ClientError as e:
             errors.append(f"S3 bucket access error: {e}")
         except Exception as e:
@@ -399,6 +670,48 @@ class ConfigManager:
         
         return errors
 
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, inode: int, mtime_ns: int, size: int) -> Any:
+    """Parse a config file; cached per file version (inode, mtime and size)"""
+    # Raw fd read sized from the stat: typically a single read(2), with no
+    # buffered/text wrapper around it
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return _json_loads(data)
+
+def _read_config_file(path: Path) -> Any:
+    """Load a config file, reusing the parsed result while it is unchanged
+    
+    Saves replace the file with a new inode, so any write invalidates the
+    cache entry. Callers get their own copy and may mutate it freely.
+    """
+    stat = os.stat(path)
+    parsed = _parse_config_file(os.fspath(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    return _clone_config_value(parsed)
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as local ISO 8601 time with second precision"""
+    t = time.localtime(timestamp)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}")
+
+def _clone_config_value(value: Any) -> Any:
+    """Recursively copy JSON-style data (dicts and lists); scalars are shared"""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone_config_value(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_config_value(item) for item in value]
+    return value
+
 class ConfigError(Exception):
     """Configuration management error"""
     pass
@@ -425,13 +738,12 @@ def main():
     if args.validate:
         try:
             config = config_manager.load_config()
-            errors = config_manager.validate_config(config)
-            if errors:
+            if config_manager.is_config_valid(config):
+                print("Configuration is valid")
+            else:
                 print("Configuration validation errors:")
-                for error in errors:
+                for error in config_manager.validate_config(config):
                     print(f"  - {error}")
-            else:
-                print("Configuration is valid")
         except Exception as e:
             print(f"Validation failed: {e}")
     
@@ -9,8 +9,15 @@ overcommitting memory while providing sufficient parallelism to saturate
 network and I/O on typical developer and server machines.
 """
 
+import os
+import time
 from dataclasses import dataclass
 
+try:
+    import psutil  # type: ignore
+except Exception:  # pragma: no cover - optional dependency at runtime
+    psutil = None  # type: ignore
+
 
 @dataclass
 class SystemSnapshot:
@@ -19,8 +26,39 @@ class SystemSnapshot:
     available_memory_bytes: int | None
 
 
+# (monotonic time taken, snapshot) of the most recent current_snapshot() probe
+_snapshot_cache: tuple[float, SystemSnapshot] | None = None
+
+
+def current_snapshot(max_age_seconds: float = 5.0) -> SystemSnapshot:
+    """Return a SystemSnapshot of this machine.
+
+    A snapshot taken within the last max_age_seconds is reused so repeated
+    tuning does not re-probe psutil (which parses /proc/meminfo on Linux).
+    Memory fields are None when psutil is unavailable.
+    """
+    global _snapshot_cache
+    now = time.monotonic()
+    cached = _snapshot_cache
+    if cached is not None and now - cached[0] < max_age_seconds:
+        return cached[1]
+    try:
+        mem_info = psutil.virtual_memory() if psutil else None
+    except Exception:
+        mem_info = None
+    snapshot = SystemSnapshot(
+        cpu_count_logical=os.cpu_count() or 1,
+        total_memory_bytes=getattr(mem_info, "total", None),
+        available_memory_bytes=getattr(mem_info, "available", None),
+    )
+    _snapshot_cache = (now, snapshot)
+    return snapshot
+
+
 def clamp(value: int, low: int, high: int) -> int:
-    return max(low, min(high, value))
+    # Same as max(low, min(high, value)) without the builtin calls
+    value = high if value > high else value
+    return low if value < low else value
 
 
 def estimate_upload_workers(
@@ -36,19 +74,20 @@ def estimate_upload_workers(
       assuming ~2× chunk size per worker (multipart buffers + overhead)
     - Hard cap for safety
     """
-    cpu = max(1, int(system.cpu_count_logical or 1))
+    cpu = max(1, system.cpu_count_logical or 1)
     available_bytes = system.available_memory_bytes or 0
     # Assume each worker might hold ~2x chunk in memory at times
     per_worker_bytes = max(8, int(chunk_size_mb)) * 1024 * 1024 * 2
     if available_bytes <= 0:
         max_by_mem = 1
     else:
-        max_by_mem = max(1, int((available_bytes * 0.25) // per_worker_bytes))
+        # 25% of available memory, in exact integer arithmetic
+        max_by_mem = max(1, available_bytes // (per_worker_bytes * 4))
 
     max_by_cpu = max(1, min(hard_cap, cpu * 2))
 
     estimate = min(hard_cap, max_by_cpu, max_by_mem)
-    return clamp(int(estimate), 1, hard_cap)
+    return clamp(estimate, 1, hard_cap)
 
 
 def estimate_check_workers(
@@ -60,9 +99,9 @@ def estimate_check_workers(
     Checks are lightweight (network + small JSON). Favor higher parallelism
     bounded by CPU and a conservative hard cap to avoid overwhelming the API.
     """
-    cpu = max(1, int(system.cpu_count_logical or 1))
+    cpu = max(1, system.cpu_count_logical or 1)
     estimate = min(hard_cap, cpu * 4)
-    return clamp(int(estimate), 1, hard_cap)
+    return clamp(estimate, 1, hard_cap)
 
 
 def estimate_worker_counts(
@@ -4,6 +4,13 @@ import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def load_config(project_root: Path, config_file: str | None) -> dict:
     if config_file:
@@ -11,8 +18,8 @@ def load_config(project_root: Path, config_file: str | None) -> dict:
     else:
         config_path = project_root / "config" / "aws-config.json"
     try:
-        with open(config_path, "r") as f:
-            return json.load(f)
+        with open(config_path, "rb") as f:
+            return _json_loads(f.read())
     except FileNotFoundError:
         print(f"❌ Configuration file not found: {config_path}")
         sys.exit(1)
@@ -1,6 +1,34 @@
 from __future__ import annotations
 
 import math
+from typing import Iterable
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - optional dependency at runtime
+    njit = None  # type: ignore
+
+
+def _ema_step(
+    previous_value: float,
+    sample_value: float,
+    delta_seconds: float,
+    time_constant_seconds: float,
+) -> float:
+    """EMA update for validated inputs (dt > 0, tau > 0)."""
+    # -expm1(-x) == 1 - exp(-x), without cancellation for small dt/tau
+    alpha = -math.expm1(-delta_seconds / time_constant_seconds)
+    # Clamp alpha to [0,1] for numerical safety; written as select
+    # expressions so the numba build can lower them to min/max instructions
+    alpha = 1.0 if alpha > 1.0 else alpha
+    alpha = 0.0 if alpha < 0.0 else alpha
+    return previous_value + alpha * (sample_value - previous_value)
+
+
+if njit is not None:  # pragma: no cover - exercised only when numba is installed
+    # Compiled once and cached on disk; the Optional/None handling stays in
+    # the Python wrapper below because nopython mode cannot take None.
+    _ema_step = njit(cache=True)(_ema_step)
 
 
 def exponential_moving_average(
@@ -21,12 +49,37 @@ def exponential_moving_average(
         return float(sample_value)
     if delta_seconds <= 0 or time_constant_seconds <= 0:
         return float(sample_value)
-    alpha = 1.0 - math.exp(-float(delta_seconds) / float(time_constant_seconds))
-    # Clamp alpha to [0,1] for numerical safety
-    if alpha < 0.0:
-        alpha = 0.0
-    elif alpha > 1.0:
-        alpha = 1.0
-    return float(previous_value) + alpha * (float(sample_value) - float(previous_value))
+    return _ema_step(
+        float(previous_value),
+        float(sample_value),
+        float(delta_seconds),
+        float(time_constant_seconds),
+    )
+
 
+def exponential_moving_average_series(
+    previous_value: float | None,
+    samples: Iterable[float],
+    deltas_seconds: Iterable[float],
+    time_constant_seconds: float,
+) -> list[float]:
+    """Apply exponential_moving_average over paired samples and time deltas.
 
+    Returns the EMA value after each sample. Equivalent to calling
+    exponential_moving_average in a loop, but the time constant is checked
+    once and the recurrence runs on local floats.
+    """
+    if time_constant_seconds <= 0:
+        return [float(sample) for sample in samples]
+    inverse_tau = 1.0 / time_constant_seconds
+    expm1 = math.expm1
+    result: list[float] = []
+    append = result.append
+    acc = None if previous_value is None else float(previous_value)
+    for sample, delta in zip(samples, deltas_seconds):
+        if acc is None or delta <= 0:
+            acc = float(sample)
+        else:
+            acc += -expm1(-delta * inverse_tau) * (sample - acc)
+        append(acc)
+    return result
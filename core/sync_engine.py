@@ -1,21 +1,138 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
+import mmap
+import os
 import random
+import re
 import threading
 import time
+from array import array
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, ConnectionError, ReadTimeoutError
 
+try:
+    import blake3  # type: ignore
+except Exception:  # pragma: no cover - optional dependency at runtime
+    blake3 = None  # type: ignore
+
+# Files above this size are sent as concurrent multipart uploads
+MULTIPART_THRESHOLD_BYTES = 100 * 1024 * 1024
+
+# S3 error codes worth retrying regardless of HTTP status
+RETRYABLE_ERROR_CODES = frozenset(
+    {"SlowDown", "Throttling", "ThrottlingException", "RequestTimeout", "RequestTimeTooSkewed", "InternalError"}
+)
+
+# Pseudo hash algorithm for S3 multipart ETags; used as "s3-etag/<part size>"
+MULTIPART_ETAG_ALGORITHM = "s3-etag"
+
+# Files at least this large are hashed through an mmap (no read buffer copy),
+# fed to hashlib in slices so one update never spans the whole file
+HASH_MMAP_MIN_BYTES = 8 * 1024 * 1024
+HASH_MMAP_SLICE_BYTES = 64 * 1024 * 1024
+# Files modified more recently than this may still be written to (or
+# truncated) and are read with buffered reads instead of mapped
+HASH_MMAP_SETTLE_SECONDS = 5.0
+
+# Files at least this large are BLAKE3-hashed with all cores (tree mode)
+BLAKE3_THREADED_MIN_BYTES = 16 * 1024 * 1024
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Regex source matching a POSIX path string exactly where PurePath.match(pattern) does.
+
+    Relative patterns match the trailing path components; absolute ones the
+    whole path. Wildcards never cross a '/'.
+    """
+    parts = []
+    for component in pattern.strip("/").split("/"):
+        i, n, out = 0, len(component), []
+        while i < n:
+            c = component[i]
+            i += 1
+            if c == "*":
+                out.append("[^/]*")
+            elif c == "?":
+                out.append("[^/]")
+            elif c == "[":
+                j = i + 1 if i < n and component[i] == "!" else i
+                j = j + 1 if j < n and component[j] == "]" else j
+                j = component.find("]", j)
+                if j < 0:
+                    out.append(re.escape(c))
+                    continue
+                body = component[i:j]
+                i = j + 1
+                negate = body.startswith("!")
+                body = re.sub(r"([\\&~|]|^[\]^])", r"\\\1", body[1:] if negate else body)
+                out.append(f"[^/{body}]" if negate else f"[{body}]")
+            else:
+                out.append(re.escape(c))
+        parts.append("".join(out))
+    anchor = "^/" if pattern.startswith("/") else "(?:^|/)"
+    return anchor + "/".join(parts) + r"\Z"
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """True for throttling, 5xx and connection-level failures."""
+    if isinstance(error, S3UploadFailedError):
+        # upload_file wraps the ClientError that caused the failure
+        cause = error.__cause__ or error.__context__
+        return cause is not None and _is_retryable(cause)
+    if isinstance(error, (ConnectionError, ReadTimeoutError)):
+        return True
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code", "")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        if code.isdigit():
+            status = status or int(code)
+        return status >= 500 or status == 429 or code in RETRYABLE_ERROR_CODES
+    return False
+
+
+def _map_settled(f) -> Optional[mmap.mmap]:
+    """Map an open file read-only; None if it is empty, recently modified or unmappable.
+
+    Touching a page past the end of a file truncated after mapping raises
+    SIGBUS and kills the process, so files that may still be changing are
+    left to buffered reads, and the size is checked again once mapped.
+    """
+    st = os.fstat(f.fileno())
+    if not st.st_size or time.time() - st.st_mtime < HASH_MMAP_SETTLE_SECONDS:
+        return None
+    try:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mapping) != os.fstat(f.fileno()).st_size:
+        mapping.close()
+        return None
+    return mapping
+
+
+@lru_cache(maxsize=None)
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Combine glob patterns into one compiled regex (None when there are none)."""
+    if not patterns:
+        return None
+    # Path.match folds case where the OS does (Windows)
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile("|".join(_glob_to_regex(p) for p in patterns), flags)
+
 
 @dataclass
 class FileToSync:
@@ -23,6 +140,33 @@ class FileToSync:
     s3_key: str
 
 
+@dataclass
+class FileBatch:
+    """Discovered files as aligned columns rather than one object per file.
+
+    Keeps a large discovery to three flat containers (sizes in a C array);
+    FileToSync objects are only built for the files that are handed on.
+    """
+
+    local_paths: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+    s3_keys: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.s3_keys)
+
+    def append(self, local_path: str, size: int, s3_key: str) -> None:
+        self.local_paths.append(local_path)
+        self.sizes.append(size)
+        self.s3_keys.append(s3_key)
+
+    def item(self, index: int) -> FileToSync:
+        return FileToSync(local_path=Path(self.local_paths[index]), s3_key=self.s3_keys[index])
+
+    def items(self) -> List[FileToSync]:
+        return [self.item(i) for i in range(len(self))]
+
+
 @dataclass
 class EngineConfig:
     profile: str
@@ -30,6 +174,7 @@ class EngineConfig:
     local_path: Path
     storage_class: str = "STANDARD"
     verify_upload: bool = True
+    # "md5", "sha256" or "blake3" (needs the optional blake3 package)
     hash_algorithm: str = "sha256"
     max_retries: int = 3
     retry_delay_base: float = 1.0
@@ -39,6 +184,14 @@ class EngineConfig:
     exclude_patterns: List[str] = None
     max_concurrent_uploads: int = 20
     max_concurrent_checks: int = 20
+    # Parts of a single multipart upload sent concurrently
+    max_concurrent_parts: int = 10
+    # Local hashing threads during checks (None = min(cpu_count, 8))
+    max_concurrent_hashes: Optional[int] = None
+    # Read size for hashing when hashlib.file_digest is unavailable
+    hash_buffer_bytes: int = 1 << 20
+    # JSON file persisting local content hashes across runs (None = memory only)
+    hash_cache_path: Optional[Path] = None
 
 
 @dataclass
@@ -64,54 +217,168 @@ class SyncEngine:
         self.config = config
         self._logger = logger or logging.getLogger("sync-engine")
         self.stats = EngineStats()
-        self._stats_lock = threading.Lock()
+
+        # Include/exclude globs compiled once; "*" includes every file
+        include = tuple(config.include_patterns or ["*"])
+        self._include_re = None if "*" in include else _compile_globs(include)
+        self._exclude_re = _compile_globs(tuple(config.exclude_patterns or ()))
+        # Every walked path starts with this, so its key is a plain slice
+        self._walk_prefix = os.path.join(str(config.local_path), "")
+
+        # (algorithm, path) -> (size, mtime_ns, hexdigest) of local files
+        self._hash_cache: Dict[Tuple[str, str], Tuple[int, int, str]] = {}
+        self._hash_cache_lock = threading.Lock()
+        self._hash_cache_dirty = False
+        self._load_hash_cache()
 
         self._session = None
         self.s3_client = None
         self.s3_resource = None
+        self._transfer_client = None
+        self._transfer_config = None
         self._setup_aws_clients()
 
+        # Long-lived pools reused by every check/upload run; threads start
+        # lazily on first use and are joined in close()
+        self._check_pool = ThreadPoolExecutor(max_workers=config.max_concurrent_checks, thread_name_prefix="sync-check")
+        self._hash_pool = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_hashes or min(os.cpu_count() or 1, 8), thread_name_prefix="sync-hash"
+        )
+        self._upload_pool = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_uploads, thread_name_prefix="sync-upload"
+        )
+
+    def close(self) -> None:
+        """Shut down the worker pools; the engine cannot run checks or uploads afterwards."""
+        for pool in (self._check_pool, self._hash_pool, self._upload_pool):
+            pool.shutdown(wait=True)
+
+    def __enter__(self) -> "SyncEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     # ---------- Public high-level API ----------
     def discover_all_files(self) -> List[FileToSync]:
-        files: List[FileToSync] = []
-        if not self.config.local_path.exists():
-            return files
-        for p in self.config.local_path.rglob("*"):
-            if p.is_file() and self._should_include_file(p):
-                key = self._calculate_s3_key(p)
-                files.append(FileToSync(local_path=p, s3_key=key))
+        files = []
+        for entry in self._walk_files():
+            files.append(FileToSync(local_path=Path(entry.path), s3_key=self._walk_key(entry.path)))
         return files
 
+    def discover_batch(self) -> FileBatch:
+        """Like discover_all_files, but columnar and with each file's size."""
+        batch = FileBatch()
+        for entry in self._walk_files():
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            batch.append(entry.path, size, self._walk_key(entry.path))
+        return batch
+
     def check_files_to_sync(
         self,
-        candidates: List[FileToSync],
+        candidates: Union[List[FileToSync], FileBatch],
         on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> List[FileToSync]:
-        """Return subset of candidates that need upload. Calls on_progress(done, total)."""
+        """Return subset of candidates that need upload. Calls on_progress(done, total).
+
+        Existence, size and ETag come from one bucket listing; only files
+        whose content has to be compared go through the check pool. With a
+        FileBatch the listing comparison uses the discovered sizes and never
+        touches the filesystem.
+        """
         if not candidates:
             return []
         total = len(candidates)
         done = 0
 
+        index = None
+        try:
+            if isinstance(candidates, FileBatch):
+                prefix = os.path.commonprefix(candidates.s3_keys)
+            else:
+                prefix = os.path.commonprefix([item.s3_key for item in candidates])
+            index = self._retry_with_backoff(self._list_bucket_index, prefix)
+        except (ClientError, ConnectionError, ReadTimeoutError) as e:
+            # e.g. no s3:ListBucket permission: fall back to one HEAD per file
+            self._logger.warning(f"Bucket listing failed, checking objects individually: {e}")
+
         result: List[FileToSync] = []
-        def worker(item: FileToSync):
-            nonlocal done
-            try:
-                if self._should_upload_file(item.local_path, item.s3_key):
-                    out = item
+        pending: List[Tuple[FileToSync, Optional[str], Optional[int]]] = []
+        if index is None:
+            items = candidates.items() if isinstance(candidates, FileBatch) else candidates
+            pending = [(item, None, None) for item in items]
+        elif isinstance(candidates, FileBatch):
+            sizes = candidates.sizes
+            for i, key in enumerate(candidates.s3_keys):
+                entry = index.get(key)
+                if entry is None or sizes[i] != entry[0]:
+                    result.append(candidates.item(i))
                 else:
-                    out = None
-            finally:
-                done += 1
-                if on_progress:
-                    on_progress(done, total)
-            return out
-
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrent_checks) as ex:
-            for fut in as_completed([ex.submit(worker, it) for it in candidates]):
-                r = fut.result()
-                if r:
-                    result.append(r)
+                    pending.append((candidates.item(i), entry[1], sizes[i]))
+        else:
+            for item in candidates:
+                entry = index.get(item.s3_key)
+                if entry is None:
+                    result.append(item)
+                    continue
+                try:
+                    size = item.local_path.stat().st_size
+                except OSError:
+                    continue
+                if size != entry[0]:
+                    result.append(item)
+                else:
+                    pending.append((item, entry[1], size))
+        if index is not None:
+            done = total - len(pending)
+            if on_progress:
+                on_progress(done, total)
+
+        # next() on a count is atomic under the GIL, so workers need no lock
+        counter = itertools.count(done + 1)
+
+        def report(item: FileToSync, needs_upload: bool) -> None:
+            if needs_upload:
+                result.append(item)
+            done = next(counter)
+            if on_progress:
+                on_progress(done, total)
+
+        def compare(item: FileToSync, algorithm: str, expected: str) -> None:
+            report(item, self._cached_file_hash(item.local_path, algorithm) != expected)
+
+        if pending:
+            # Two stages at their own concurrency: HEAD requests on the
+            # I/O-sized pool, local hashing on a CPU-sized one. Hashes start
+            # as soon as their HEAD returns, so neither stage waits for the other.
+            hash_futures = []
+            head_futures = {}
+            try:
+                for item, etag, size in pending:
+                    if etag is None or "-" in etag:
+                        # Multipart ETags need the stored content hash from HEAD
+                        fut = self._check_pool.submit(self._head_decision, item.local_path, item.s3_key, size)
+                        head_futures[fut] = item
+                    else:
+                        hash_futures.append(self._hash_pool.submit(compare, item, "md5", etag))
+                for fut in as_completed(head_futures):
+                    item = head_futures[fut]
+                    decision = fut.result()
+                    if isinstance(decision, bool):
+                        report(item, decision)
+                    else:
+                        hash_futures.append(self._hash_pool.submit(compare, item, *decision))
+                for fut in as_completed(hash_futures):
+                    fut.result()
+            except BaseException:
+                # The pools outlive this call: drop this run's queued work
+                for fut in [*head_futures, *hash_futures]:
+                    fut.cancel()
+                raise
+        self._save_hash_cache()
         return result
 
     def upload_files(
@@ -121,70 +388,133 @@ class SyncEngine:
         on_progress: Optional[Callable[[int, int], None]] = None,
     ) -> None:
         total = len(files)
-        completed = 0
+        counter = itertools.count(1)
+        # Per-thread [uploaded, failed, bytes] tallies: each list is only
+        # touched by its own thread, and they are summed once at the end
+        tallies: Dict[int, List[int]] = {}
 
         def worker(item: FileToSync):
-            nonlocal completed
+            tally = tallies.setdefault(threading.get_ident(), [0, 0, 0])
             local_file = item.local_path
             s3_key = item.s3_key
+            # One stat per file, reused for stats and the callback
             try:
-                if local_file.stat().st_size <= 100 * 1024 * 1024:
-                    ok = self._upload_file_simple(local_file, s3_key)
-                else:
-                    ok = self._upload_file_multipart(local_file, s3_key)
+                size = local_file.stat().st_size
+            except OSError:
+                size = 0
+            ok = False
+            try:
+                ok = self._upload_file_simple(local_file, s3_key)
                 if ok and self.config.verify_upload:
                     self.stats.verifications_total += 1
-                    if self._verify_upload(local_file, s3_key):
+                    if self._verify_upload(local_file, s3_key, size):
                         self.stats.verifications_passed += 1
                     else:
                         ok = False
-                if ok:
-                    with self._stats_lock:
-                        size = local_file.stat().st_size
-                        self.stats.files_uploaded += 1
-                        self.stats.bytes_uploaded += size
-                else:
-                    with self._stats_lock:
-                        self.stats.files_failed += 1
                 return ok
             finally:
-                completed += 1
+                # Counted here so uploads that raised are tallied as failed
+                if ok:
+                    tally[0] += 1
+                    tally[2] += size
+                else:
+                    tally[1] += 1
+                completed = next(counter)
                 if on_file_done:
-                    size = 0
-                    try:
-                        size = local_file.stat().st_size
-                    except Exception:
-                        size = 0
                     on_file_done(item, ok, size)
                 if on_progress:
                     on_progress(completed, total)
 
-        with ThreadPoolExecutor(max_workers=self.config.max_concurrent_uploads) as ex:
-            list(as_completed([ex.submit(worker, it) for it in files]))
+        list(as_completed([self._upload_pool.submit(worker, it) for it in files]))
+        for uploaded, failed, nbytes in tallies.values():
+            self.stats.files_uploaded += uploaded
+            self.stats.files_failed += failed
+            self.stats.bytes_uploaded += nbytes
+        self._save_hash_cache()
 
     # ---------- AWS setup ----------
     def _setup_aws_clients(self):
         try:
             self._session = boto3.Session(profile_name=self.config.profile)
-            cfg = Config(connect_timeout=30, read_timeout=60, retries={"max_attempts": 3, "mode": "adaptive"})
+            # One client is shared by every pool; size its urllib3 connection
+            # pool for checks and uploads running at once (default is 10)
+            workers = max(self.config.max_concurrent_uploads, self.config.max_concurrent_checks, 20)
+            cfg = Config(
+                connect_timeout=30,
+                read_timeout=60,
+                # _retry_with_backoff is the single retry layer for this client
+                retries={"total_max_attempts": 1, "mode": "standard"},
+                max_pool_connections=workers * 2,
+                tcp_keepalive=True,
+                signature_version="s3v4",
+                s3={"addressing_style": "virtual"},
+            )
             self.s3_client = self._session.client("s3", config=cfg)
+            # upload_file's requests (PutObject, each UploadPart) are made
+            # inside s3transfer, out of reach of _retry_with_backoff, so its
+            # client keeps botocore's own retries: a throttled part is
+            # retried alone instead of failing the whole multipart upload
+            self._transfer_client = self._session.client("s3", config=cfg.merge(Config(
+                retries={"total_max_attempts": self.config.max_retries + 1, "mode": "standard"},
+            )))
             self.s3_resource = self._session.resource("s3")
-            self.s3_client.list_buckets()
+            # upload_file switches to concurrent multipart above the threshold
+            self._transfer_config = TransferConfig(
+                multipart_threshold=MULTIPART_THRESHOLD_BYTES,
+                multipart_chunksize=self.config.chunk_size_mb * 1024 * 1024,
+                max_concurrency=self.config.max_concurrent_parts,
+                use_threads=True,
+            )
+            self._retry_with_backoff(self.s3_client.list_buckets)
         except NoCredentialsError as e:
             raise e
         except ClientError as e:
             raise e
 
     # ---------- Helpers (pure, no UI) ----------
+    def _walk_files(self) -> List[os.DirEntry]:
+        """Every included file under local_path.
+
+        Walks first, then filters all paths against the compiled patterns in
+        one comprehension; no Path objects are built for either step.
+        """
+        entries: List[os.DirEntry] = []
+        if not self.config.local_path.exists():
+            return entries
+        # Explicit scandir walk: DirEntry type checks come from the directory
+        # listing itself, so regular files and dirs cost no extra stat
+        stack = [str(self.config.local_path)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        entries.append(entry)
+
+        include, exclude = self._include_re, self._exclude_re
+        if include is None and exclude is None:
+            return entries
+        paths = [entry.path for entry in entries]
+        if os.sep != "/":
+            paths = [p.replace(os.sep, "/") for p in paths]
+        include_search = include.search if include is not None else None
+        exclude_search = exclude.search if exclude is not None else None
+        return [
+            entry
+            for entry, p in zip(entries, paths)
+            if (include_search is None or include_search(p)) and (exclude_search is None or not exclude_search(p))
+        ]
+
     def _should_include_file(self, file_path: Path) -> bool:
-        include = self.config.include_patterns or ["*"]
-        exclude = self.config.exclude_patterns or []
-        included = any(file_path.match(p) for p in include)
-        if not included:
+        path = file_path.as_posix()
+        if self._include_re is not None and not self._include_re.search(path):
             return False
-        if any(file_path.match(p) for p in exclude):
-            return False
-        return True
+        return not (self._exclude_re is not None and self._exclude_re.search(path))
 
     def _calculate_s3_key(self, file_path: Path) -> str:
         try:
@@ -200,131 +530,299 @@ class SyncEngine:
                 key = file_path.name
             return key.replace("\\", "/").lstrip("/")
 
+    def _walk_key(self, path: str) -> str:
+        """S3 key for a path string produced by _walk_files."""
+        if path.startswith(self._walk_prefix):
+            key = path[len(self._walk_prefix):]
+            return key.replace(os.sep, "/") if os.sep != "/" else key
+        return self._calculate_s3_key(Path(path))
+
+    def _object_metadata(self, local_file: Path) -> Dict[str, str]:
+        """User metadata stored with each uploaded object."""
+        metadata = {
+            "original-filename": local_file.name,
+            "upload-timestamp": datetime.now().isoformat(),
+            "hash-algorithm": self.config.hash_algorithm,
+        }
+        algorithm = self.config.hash_algorithm
+        if algorithm != "md5":
+            # Single-part ETags already are the MD5; anything else is stored so
+            # later runs can compare content even for multipart objects
+            metadata[f"content-{algorithm}"] = self._cached_file_hash(local_file, algorithm)
+        # Lets a later run recompute the ETag if the upload went multipart
+        metadata["chunk-size"] = str(self.config.chunk_size_mb * 1024 * 1024)
+        return metadata
+
+    def _list_bucket_index(self, prefix: str = "") -> Dict[str, Tuple[int, str]]:
+        """Map each key under prefix to (size, etag), 1000 keys per ListObjectsV2 call."""
+        index: Dict[str, Tuple[int, str]] = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                index[obj["Key"]] = (obj["Size"], obj["ETag"].strip('"'))
+        return index
+
     def _get_s3_object_metadata(self, key: str):
         try:
-            r = self.s3_client.head_object(Bucket=self.config.bucket_name, Key=key)
-            return {"etag": r["ETag"].strip('"'), "size": r["ContentLength"], "last_modified": r["LastModified"]}
+            r = self._retry_with_backoff(self.s3_client.head_object, Bucket=self.config.bucket_name, Key=key)
+            return {
+                "etag": r["ETag"].strip('"'),
+                "size": r["ContentLength"],
+                "last_modified": r["LastModified"],
+                "metadata": r.get("Metadata") or {},
+            }
         except ClientError as e:
             if e.response.get("Error", {}).get("Code") == "404":
                 return None
             return None
 
-    def _should_upload_file(self, local_file: Path, s3_key: str) -> bool:
-        if not local_file.exists():
-            return False
+    def _should_upload_file(self, local_file: Path, s3_key: str, local_size: Optional[int] = None) -> bool:
+        decision = self._head_decision(local_file, s3_key, local_size)
+        if isinstance(decision, bool):
+            return decision
+        algorithm, expected = decision
+        return self._cached_file_hash(local_file, algorithm) != expected
+
+    def _head_decision(
+        self, local_file: Path, s3_key: str, local_size: Optional[int] = None
+    ) -> Union[bool, Tuple[str, str]]:
+        """The HEAD half of _should_upload_file.
+
+        Returns the decision when the remote metadata settles it, otherwise
+        (algorithm, expected_digest) for the local file to be hashed against.
+        """
+        if local_size is None:
+            try:
+                local_size = local_file.stat().st_size
+            except OSError:
+                return False
         meta = self._get_s3_object_metadata(s3_key)
         if not meta:
             return True
-        if local_file.stat().st_size != meta["size"]:
+        if local_size != meta["size"]:
             return True
+        # Prefer the content hash stored at upload time: with the local hash
+        # cache, unchanged files are not re-read at all
+        algorithm = self.config.hash_algorithm
+        stored = meta.get("metadata", {}).get(f"content-{algorithm}")
+        if stored:
+            return algorithm, stored
         etag = meta["etag"]
         if "-" in etag:
-            return False
-        local_md5 = self._calculate_file_hash(local_file, "md5")
-        return bool(local_md5 and local_md5 != etag)
+            # Multipart ETag: MD5 of the part MD5s, comparable once the part
+            # size is known; skip only if it cannot be reconstructed
+            part_size = self._multipart_part_size(local_size, etag, meta.get("metadata", {}))
+            if part_size is None:
+                return False
+            return f"{MULTIPART_ETAG_ALGORITHM}/{part_size}", etag
+        return "md5", etag
+
+    def _multipart_part_size(self, size: int, etag: str, metadata: Dict[str, str]) -> Optional[int]:
+        """Part size that yields the part count in a multipart ETag, or None."""
+        try:
+            parts = int(etag.rsplit("-", 1)[1])
+        except ValueError:
+            return None
+        if parts < 1:
+            return None
+        mib = 1024 * 1024
+        candidates = []
+        stored = metadata.get("chunk-size", "")
+        if stored.isdigit():
+            candidates.append(int(stored))
+        # Our configured size, the AWS CLI/boto3 default, then an even split
+        per_part = -(-size // parts)
+        candidates += [self.config.chunk_size_mb * mib, 8 * mib, -(-per_part // mib) * mib]
+        for candidate in candidates:
+            if candidate > 0 and max(1, -(-size // candidate)) == parts:
+                return candidate
+        return None
+
+    def _cached_file_hash(self, file_path: Path, algorithm: str) -> Optional[str]:
+        """Hash a local file, reusing the result while its size and mtime are unchanged."""
+        st = os.stat(file_path)
+        key = (algorithm, os.path.abspath(file_path))
+        entry = self._hash_cache.get(key)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        digest = self._calculate_file_hash(file_path, algorithm)
+        if digest:
+            with self._hash_cache_lock:
+                self._hash_cache[key] = (st.st_size, st.st_mtime_ns, digest)
+                self._hash_cache_dirty = True
+        return digest
+
+    def _load_hash_cache(self) -> None:
+        path = self.config.hash_cache_path
+        if not path:
+            return
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            self._hash_cache = {
+                (algorithm, file_path): (size, mtime_ns, digest)
+                for algorithm, file_path, size, mtime_ns, digest in data.get("entries", [])
+            }
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as e:
+            # A corrupt cache only costs re-hashing; start empty
+            self._logger.warning(f"Ignoring unreadable hash cache {path}: {e}")
+
+    def _save_hash_cache(self) -> None:
+        path = self.config.hash_cache_path
+        if not path or not self._hash_cache_dirty:
+            return
+        with self._hash_cache_lock:
+            entries = [[*key, *value] for key, value in self._hash_cache.items()]
+            self._hash_cache_dirty = False
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump({"entries": entries}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            self._logger.warning(f"Could not save hash cache {path}: {e}")
 
     def _calculate_file_hash(self, file_path: Path, algorithm: str) -> Optional[str]:
-        if algorithm == "md5":
-            h = hashlib.md5()
-        elif algorithm == "sha256":
-            h = hashlib.sha256()
-        else:
+        if algorithm == "blake3":
+            return self._calculate_blake3(file_path)
+        if algorithm.startswith(MULTIPART_ETAG_ALGORITHM + "/"):
+            return self._calculate_multipart_etag(file_path, int(algorithm.split("/", 1)[1]))
+        if algorithm not in ("md5", "sha256"):
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                h.update(chunk)
+        # Unbuffered: the paths below read straight into their own buffer
+        with open(file_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= HASH_MMAP_MIN_BYTES:
+                digest = self._hash_mapped(f, algorithm)
+                if digest is not None:
+                    return digest
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: readinto one reused buffer, no bytes object per chunk
+                return hashlib.file_digest(f, algorithm).hexdigest()
+            h = hashlib.new(algorithm)
+            buf = bytearray(self.config.hash_buffer_bytes)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                h.update(view[:n])
+        return h.hexdigest()
+
+    def _calculate_multipart_etag(self, file_path: Path, part_size: int) -> str:
+        """The ETag S3 gives a multipart upload of this file in part_size parts."""
+        md5 = hashlib.md5
+        digests = []
+        with open(file_path, "rb", buffering=0) as f:
+            mapping = _map_settled(f)
+            if mapping is not None:
+                with mapping, memoryview(mapping) as view:
+                    for offset in range(0, len(mapping), part_size):
+                        digests.append(md5(view[offset:offset + part_size]).digest())
+            else:
+                buf = bytearray(min(self.config.hash_buffer_bytes, part_size))
+                view = memoryview(buf)
+                while True:
+                    h = md5()
+                    remaining = part_size
+                    while remaining:
+                        n = f.readinto(view[:min(remaining, len(buf))])
+                        if not n:
+                            break
+                        h.update(view[:n])
+                        remaining -= n
+                    if remaining == part_size and digests:
+                        break
+                    digests.append(h.digest())
+                    if remaining:
+                        break
+        return f"{md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+    def _hash_mapped(self, f, algorithm: str) -> Optional[str]:
+        """Hash an open file straight from the page cache; None if it is not mapped."""
+        mapping = _map_settled(f)
+        if mapping is None:
+            return None
+        h = hashlib.new(algorithm)
+        with mapping:
+            if hasattr(mapping, "madvise"):
+                mapping.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapping) as view:
+                for offset in range(0, len(mapping), HASH_MMAP_SLICE_BYTES):
+                    # hashlib releases the GIL while digesting each slice
+                    h.update(view[offset:offset + HASH_MMAP_SLICE_BYTES])
+        return h.hexdigest()
+
+    def _calculate_blake3(self, file_path: Path) -> str:
+        if blake3 is None:
+            raise ValueError("Unsupported hash algorithm: blake3 (install the 'blake3' package)")
+        size = os.stat(file_path).st_size
+        threads = blake3.blake3.AUTO if size >= BLAKE3_THREADED_MIN_BYTES else 1
+        h = blake3.blake3(max_threads=threads)
+        # Memory-maps the file and hashes it without holding the GIL
+        h.update_mmap(file_path)
         return h.hexdigest()
 
     def _retry_with_backoff(self, func, *args, **kwargs):
-        last = None
+        """Call func, retrying transient S3/network failures with decorrelated jitter.
+
+        This is the only retry layer for s3_client (botocore's is disabled on
+        it in _setup_aws_clients); client errors such as 403/404 fail
+        immediately. Uploads go through _transfer_client, which botocore
+        retries per request instead.
+        """
+        base = self.config.retry_delay_base
+        delay = base
         for attempt in range(self.config.max_retries + 1):
             try:
                 return func(*args, **kwargs)
-            except (ClientError, ConnectionError, ReadTimeoutError) as e:
-                last = e
-                if attempt == self.config.max_retries:
-                    raise last
-                delay = min(self.config.retry_delay_base * (2 ** attempt), self.config.retry_delay_max)
-                jitter = random.uniform(0, 0.1 * delay)
-                time.sleep(delay + jitter)
-        raise last
+            except (ClientError, ConnectionError, ReadTimeoutError, S3UploadFailedError) as e:
+                if attempt == self.config.max_retries or not _is_retryable(e):
+                    raise
+                delay = min(self.config.retry_delay_max, random.uniform(base, delay * 3))
+                time.sleep(delay)
 
     def _upload_file_simple(self, local_file: Path, s3_key: str) -> bool:
-        def op():
-            extra = {
-                "StorageClass": self.config.storage_class,
-                "Metadata": {
-                    "original-filename": local_file.name,
-                    "upload-timestamp": datetime.now().isoformat(),
-                    "hash-algorithm": self.config.hash_algorithm,
-                },
-            }
-            self.s3_client.upload_file(str(local_file), self.config.bucket_name, s3_key, ExtraArgs=extra)
-            return True
-        return self._retry_with_backoff(op)
-
-    def _upload_file_multipart(self, local_file: Path, s3_key: str) -> bool:
-        file_size = local_file.stat().st_size
-        chunk_size = self.config.chunk_size_mb * 1024 * 1024
-
-        def create():
-            return self.s3_client.create_multipart_upload(
-                Bucket=self.config.bucket_name,
-                Key=s3_key,
-                StorageClass=self.config.storage_class,
-                Metadata={
-                    "original-filename": local_file.name,
-                    "upload-timestamp": datetime.now().isoformat(),
-                    "hash-algorithm": self.config.hash_algorithm,
-                },
-            )
-
-        mpu = self._retry_with_backoff(create)
-        parts = []
-        part_number = 1
-        try:
-            with open(local_file, "rb") as f:
-                while True:
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
-                    def upload_part():
-                        return self.s3_client.upload_part(
-                            Bucket=self.config.bucket_name,
-                            Key=s3_key,
-                            PartNumber=part_number,
-                            UploadId=mpu["UploadId"],
-                            Body=data,
-                        )
-                    r = self._retry_with_backoff(upload_part)
-                    parts.append({"ETag": r["ETag"], "PartNumber": part_number})
-                    part_number += 1
-
-            def complete():
-                return self.s3_client.complete_multipart_upload(
-                    Bucket=self.config.bucket_name,
-                    Key=s3_key,
-                    UploadId=mpu["UploadId"],
-                    MultipartUpload={"Parts": parts},
-                )
-            self._retry_with_backoff(complete)
-            return True
-        except Exception:
-            try:
-                self.s3_client.abort_multipart_upload(Bucket=self.config.bucket_name, Key=s3_key, UploadId=mpu["UploadId"])
-            except Exception:
-                pass
-            return False
+        extra = {
+            "StorageClass": self.config.storage_class,
+            "Metadata": self._object_metadata(local_file),
+        }
+
+        # Retried per request by the transfer client's botocore retries;
+        # wrapping this in _retry_with_backoff as well would multiply them
+        self._transfer_client.upload_file(
+            str(local_file),
+            self.config.bucket_name,
+            s3_key,
+            ExtraArgs=extra,
+            Config=self._transfer_config,
+        )
+        return True
 
-    def _verify_upload(self, local_file: Path, s3_key: str) -> bool:
+    def _verify_upload(self, local_file: Path, s3_key: str, local_size: Optional[int] = None) -> bool:
         meta = self._get_s3_object_metadata(s3_key)
         if not meta:
             return False
-        if local_file.stat().st_size != meta["size"]:
+        if local_size is None:
+            local_size = local_file.stat().st_size
+        if local_size != meta["size"]:
             return False
         if self.config.hash_algorithm == "md5":
-            local = self._calculate_file_hash(local_file, "md5")
-            if local and local != meta["etag"]:
+            etag = meta["etag"]
+            algorithm = "md5"
+            if "-" in etag:
+                # Uploads past MULTIPART_THRESHOLD_BYTES carry a multipart ETag,
+                # reproducible from the part size they were sent with
+                part_size = self._multipart_part_size(local_size, etag, meta.get("metadata", {}))
+                if part_size is None:
+                    return False
+                algorithm = f"{MULTIPART_ETAG_ALGORITHM}/{part_size}"
+            local = self._calculate_file_hash(local_file, algorithm)
+            if local and local != etag:
                 return False
         return True
 
@@ -11,11 +11,135 @@ Usage:
 """
 
 import argparse
+import json
+import re
+import shlex
+import shutil
 import subprocess
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover - optional dependency at runtime
+    ahocorasick = None  # type: ignore
+
+try:
+    import re2  # type: ignore
+except Exception:  # pragma: no cover - optional dependency at runtime
+    re2 = None  # type: ignore
+
+# Files removed from history by the generated cleanup scripts
+SENSITIVE_FILES = [
+    'config/aws-credentials.json',
+    'config/aws-config.json',
+    'config/sync-config.json',
+]
+
+# History checks: (name, regex or literal text, description for the report)
+HISTORY_REGEX_CHECKS = [
+    ('access_key', r'AKIA[0-9A-Z]{16}', 'AWS access keys'),
+]
+HISTORY_LITERAL_CHECKS = [
+    ('bucket_name', 'REMOVED_BUCKET_NAME ', 'real bucket name'),
+    ('account_id', 'REMOVED_ACCOUNT_ID', 'real account ID'),
+]
+HISTORY_CHECKS = HISTORY_REGEX_CHECKS + HISTORY_LITERAL_CHECKS
+
+# Regexes run on re2 (linear time) when installed. Literals are matched in
+# one pass by an Aho-Corasick automaton when pyahocorasick is installed,
+# otherwise by a substring search each
+_HISTORY_REGEXES = [
+    (name, (re2 or re).compile(pattern.encode()))
+    for name, pattern, _ in HISTORY_REGEX_CHECKS
+]
+_HISTORY_LITERALS = [(name, text.encode()) for name, text, _ in HISTORY_LITERAL_CHECKS]
+if ahocorasick is not None:
+    _HISTORY_AUTOMATON = ahocorasick.Automaton()
+    for _name, _text, _ in HISTORY_LITERAL_CHECKS:
+        _HISTORY_AUTOMATON.add_word(_text, _name)
+    _HISTORY_AUTOMATON.make_automaton()
+else:
+    _HISTORY_AUTOMATON = None
+
+def _find_sensitive(data):
+    """Names of the history checks matching the bytes in data"""
+    found = {name for name, pattern in _HISTORY_REGEXES if pattern.search(data)}
+    if _HISTORY_AUTOMATON is not None:
+        # The automaton works on str; latin-1 maps each byte to one character
+        found.update(name for _, name in _HISTORY_AUTOMATON.iter(data.decode('latin-1')))
+    else:
+        found.update(name for name, text in _HISTORY_LITERALS if text in data)
+    return found
+
+def _write_exec(path, content, mode=0o755):
+    """Write a generated file that is created with its final mode
+    
+    The script never exists on disk without its execute bit, and no separate
+    chmod is needed. The mode only applies when the file is created.
+    """
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.write(fd, content.encode())
+    finally:
+        os.close(fd)
+
+# History with more than this many blobs per CPU is scanned in parallel slices
+SCAN_SLICE_BLOBS = 5000
+
+# Ref tips and findings of the last complete history scan, so later scans
+# only read history added since
+SCAN_CACHE_FILE = '.sensitive-scan-cache.json'
+
+# Blobs are scanned at most this many bytes at a time; consecutive chunks
+# overlap by more than the longest text any history check matches
+SCAN_CHUNK_BYTES = 16 * 1024 * 1024
+SCAN_OVERLAP_BYTES = 256
+
+def _scan_checks():
+    """The history checks a scan runs, as recorded in its cache"""
+    return [[name, pattern] for name, pattern, _ in HISTORY_CHECKS]
+
+def _feed_lines(stream, lines):
+    """Write lines to a subprocess's stdin, ignoring a process that went away"""
+    try:
+        stream.write(b''.join(line + b'\n' for line in lines))
+        stream.flush()
+    except (BrokenPipeError, ValueError):
+        pass
+
+def _stop_process(proc):
+    # Terminated first: a feeder thread blocked writing to stdin holds its
+    # lock until the write fails
+    proc.terminate()
+    proc.wait()
+    for stream in (proc.stdin, proc.stdout):
+        try:
+            stream.close()
+        except (BrokenPipeError, ValueError):
+            pass
+
+def _scan_stream(stream, size):
+    """Names of the history checks matching the next size bytes of stream
+    
+    Large blobs are never held in memory whole.
+    """
+    found = set()
+    tail = b''
+    while size > 0:
+        chunk = stream.read(min(size, SCAN_CHUNK_BYTES))
+        if not chunk:
+            break
+        size -= len(chunk)
+        data = tail + chunk
+        found.update(_find_sensitive(data))
+        tail = data[-SCAN_OVERLAP_BYTES:]
+    return found
+
 class GitHistoryCleaner:
     def __init__(self):
         self.project_root = Path(__file__).parent.parent
@@ -26,141 +150,341 @@ class GitHistoryCleaner:
             'REMOVED_ACCOUNT_ID',  # Real account ID
         ]
         
+    @cached_property
+    def _tools(self):
+        """Which history-rewriting tools are installed, looked up once per cleaner
+        
+        PATH lookups only: running `bfg --version` would start a JVM just to
+        learn that it exists.
+        """
+        bfg_jar = self.project_root / "bfg.jar"
+        if shutil.which('bfg'):
+            bfg = 'bfg'
+        elif bfg_jar.is_file() and shutil.which('java'):
+            bfg = f'java -jar {shlex.quote(str(bfg_jar))}'
+        else:
+            bfg = None
+        return {
+            'bfg': bfg,
+            'filter-repo': shutil.which('git-filter-repo') is not None,
+        }
+    
     def check_bfg_available(self):
-        """Check if BFG Repo-Cleaner is available"""
-        try:
-            result = subprocess.run(['bfg', '--version'], 
-                                  capture_output=True, text=True)
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """Check if BFG Repo-Cleaner is available (on PATH or as bfg.jar)"""
+        return self._tools['bfg'] is not None
     
-    def create_bfg_script(self):
-        """Create BFG script to remove sensitive files"""
-        bfg_script = self.project_root / "bfg-clean.sh"
+    def check_filter_repo_available(self):
+        """Check if git filter-repo is available"""
+        return self._tools['filter-repo']
+    
+    @cached_property
+    def _bfg_script_content(self):
+        """The BFG script, generated once from the sensitive file list"""
+        bfg = self._tools['bfg'] or 'bfg'
+        delete_files = '\n'.join(
+            f'{bfg} --delete-files {shlex.quote(Path(path).name)}' for path in SENSITIVE_FILES
+        )
         
-        script_content = """#!/bin/bash
+        return f"""#!/bin/bash
 # BFG Repo-Cleaner script to remove sensitive data from Git history
 
 echo "🧹 Cleaning Git history of sensitive data..."
 
 # Remove files that might contain credentials
-bfg --delete-files aws-credentials.json
-bfg --delete-files aws-config.json
-bfg --delete-files sync-config.json
+{delete_files}
 
 # Remove lines containing sensitive patterns
-bfg --replace-text sensitive-patterns.txt
+{bfg} --replace-text sensitive-patterns.txt
 
 echo "✅ Git history cleaned successfully!"
 echo "⚠️  IMPORTANT: Run 'git push --force' to update remote repository"
 """
-        
-        with open(bfg_script, 'w') as f:
-            f.write(script_content)
-        
-        os.chmod(bfg_script, 0o755)
+    
+    def create_bfg_script(self):
+        """Create BFG script to remove sensitive files"""
+        bfg_script = self.project_root / "bfg-clean.sh"
+        _write_exec(bfg_script, self._bfg_script_content)
         return bfg_script
     
     def create_sensitive_patterns_file(self):
         """Create file with sensitive patterns for BFG"""
         patterns_file = self.project_root / "sensitive-patterns.txt"
         
-        patterns = [
-            # AWS Access Keys
-            'AKIA[0-9A-Z]{16}',
-            # Real bucket name
-            'REMOVED_BUCKET_NAME ',
-            # Real account ID
-            'REMOVED_ACCOUNT_ID',
-            # Real credentials (if any were committed)
-            'ycLHdrC3csBcY27AmzVXoZB9pCyvzFt9iIpPa+OK',
-        ]
+        # The history checks (BFG and filter-repo take literals unless
+        # prefixed), plus real credentials if any were committed
+        patterns = [f'regex:{pattern}' for _, pattern, _ in HISTORY_REGEX_CHECKS]
+        patterns += [text for _, text, _ in HISTORY_LITERAL_CHECKS]
+        patterns.append('ycLHdrC3csBcY27AmzVXoZB9pCyvzFt9iIpPa+OK')
         
-        with open(patterns_file, 'w') as f:
-            for pattern in patterns:
-                f.write(f'{pattern}==>REMOVED\n')
+        _write_exec(patterns_file, ''.join(f'{pattern}==>REMOVED\n' for pattern in patterns), mode=0o644)
         
         return patterns_file
     
     def create_git_filter_script(self):
-        """Create git filter-branch script as alternative to BFG"""
+        """Create git filter-repo script (filter-branch fallback) as alternative to BFG"""
         filter_script = self.project_root / "git-filter-clean.sh"
         
-        script_content = """#!/bin/bash
-# Git filter-branch script to remove sensitive data from Git history
-
-echo "🧹 Cleaning Git history using git filter-branch..."
+        # Commits older than the first one adding a sensitive file are left
+        # alone; filter-branch only rewrites what it is given
+        base = self.find_earliest_sensitive_commit()
+        exclude = f" ^{base}^" if base else ""
+        
+        paths = ' \\\n'.join(f'        --path {shlex.quote(path)}' for path in SENSITIVE_FILES)
+        index_paths = ' '.join(shlex.quote(path) for path in SENSITIVE_FILES)
+        
+        script_content = f"""#!/bin/bash
+# Git filter-repo script to remove sensitive data from Git history,
+# falling back to git filter-branch when filter-repo is not installed
 
 # Create a backup branch
 git branch backup-before-clean
 
-# Remove sensitive files from all commits
-git filter-branch --force --index-filter '
-    git rm --cached --ignore-unmatch config/aws-credentials.json 2>/dev/null || true
-    git rm --cached --ignore-unmatch config/aws-config.json 2>/dev/null || true
-    git rm --cached --ignore-unmatch config/sync-config.json 2>/dev/null || true
-' --prune-empty --tag-name-filter cat -- --all
-
-# Clean up refs and force garbage collection
-git for-each-ref --format="%(refname)" refs/original/ | xargs -n 1 git update-ref -d
-git reflog expire --expire=now --all
-git gc --prune=now --aggressive
+if command -v git-filter-repo >/dev/null 2>&1; then
+    echo "🧹 Cleaning Git history using git filter-repo..."
+    
+    # One fast-export/fast-import pass drops the files and scrubs the
+    # patterns from every commit; filter-repo expires reflogs and repacks
+    git filter-repo --force --invert-paths \\
+{paths} \\
+        --replace-text "$(dirname "$0")/sensitive-patterns.txt"
+else
+    echo "🧹 Cleaning Git history using git filter-branch..."
+    
+    # Remove sensitive files from all commits: one update-index per
+    # commit drops every path, instead of one git rm per path
+    git filter-branch --force --index-filter '
+        printf "%s\\n" {index_paths} |
+            git update-index --force-remove --stdin 2>/dev/null || true
+    ' --prune-empty --tag-name-filter cat -- --all{exclude}
+    
+    # Clean up refs (one update-ref transaction for all of them)
+    git for-each-ref --format="delete %(refname)" refs/original/ | git update-ref --stdin
+    git reflog expire --expire=now --all
+    
+    # Repack what is still reachable and drop the rest. Deltas are
+    # recomputed once with the default window rather than gc --aggressive's
+    # much larger one, grouped by path where git supports it (2.49+)
+    if git repack -h 2>&1 | grep -q -- --path-walk; then
+        git repack -adf --path-walk
+    else
+        git repack -adf
+    fi
+    git prune --expire=now
+fi
 
 echo "✅ Git history cleaned successfully!"
 echo "⚠️  IMPORTANT: Run 'git push --force' to update remote repository"
 """
         
-        with open(filter_script, 'w') as f:
-            f.write(script_content)
-        
-        os.chmod(filter_script, 0o755)
+        _write_exec(filter_script, script_content)
         return filter_script
     
-    def check_sensitive_data_in_history(self):
-        """Check if sensitive data exists in Git history"""
-        print("🔍 Checking Git history for sensitive data...")
+    def find_earliest_sensitive_commit(self):
+        """Earliest commit adding a sensitive file, if it has a parent
         
-        sensitive_found = False
+        Commits are listed parents-first (--topo-order --reverse), so no
+        other commit adding one of the files is an ancestor of its parent.
+        """
+        try:
+            result = subprocess.run(
+                ['git', 'log', '--all', '--topo-order', '--reverse', '--diff-filter=A',
+                 '--format=%H', '--'] + SENSITIVE_FILES,
+                cwd=self.project_root, capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            return None
+        commits = result.stdout.split()
+        if not commits:
+            return None
         
-        # Check for AWS access keys
+        # A root commit has no parent to exclude
+        commit = self._read_object(commits[0])
+        if commit is None or b'\nparent ' not in commit.split(b'\n\n', 1)[0]:
+            return None
+        return commits[0]
+    
+    def _ref_tips(self):
+        """Commits (or tags) every ref currently points at"""
         try:
-            result = subprocess.run([
-                'git', 'log', '--all', '--full-history', '-p', 
-                '|', 'grep', '-E', 'AKIA[0-9A-Z]{16}'
-            ], shell=True, capture_output=True, text=True)
-            
-            if result.stdout.strip():
-                print("❌ Found AWS access keys in Git history")
-                sensitive_found = True
-        except:
-            pass
+            result = subprocess.run(
+                ['git', 'for-each-ref', '--format=%(objectname)'],
+                cwd=self.project_root, capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            return []
+        return sorted(set(result.stdout.split()))
+    
+    def _load_scan_cache(self):
+        """Ref tips and findings of the last complete scan, or None
         
-        # Check for real bucket name
+        The cache only holds while every cached tip is still reachable from
+        the current refs, i.e. the history it covered has not been rewritten
+        or dropped since, and the history checks are the ones it ran.
+        """
         try:
-            result = subprocess.run([
-                'git', 'log', '--all', '--full-history', '-p',
-                '|', 'grep', 'REMOVED_BUCKET_NAME '
-            ], shell=True, capture_output=True, text=True)
-            
-            if result.stdout.strip():
-                print("❌ Found real bucket name in Git history")
-                sensitive_found = True
-        except:
+            cache = json.loads((self.project_root / SCAN_CACHE_FILE).read_text())
+            tips, names = list(cache['tips']), set(cache['found'])
+            if cache['checks'] != _scan_checks():
+                return None
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        unreachable = subprocess.run(
+            ['git', 'rev-list', '--count', '--stdin', '--not', '--all'],
+            cwd=self.project_root, input=''.join(f'{tip}\n' for tip in tips),
+            capture_output=True, text=True
+        )
+        if unreachable.returncode != 0 or unreachable.stdout.strip() != '0':
+            return None
+        return tips, names
+    
+    def _save_scan_cache(self, tips, found):
+        """Record a complete scan of the history reachable from tips"""
+        try:
+            (self.project_root / SCAN_CACHE_FILE).write_text(
+                json.dumps({'checks': _scan_checks(), 'tips': tips, 'found': sorted(found)}, indent=2)
+            )
+        except OSError:
             pass
+    
+    def _history_blobs(self, known=()):
+        """Object IDs of every blob reachable from any ref, each listed once
         
-        # Check for real account ID
+        Blobs already reachable from the known commits are left out.
+        """
         try:
-            result = subprocess.run([
-                'git', 'log', '--all', '--full-history', '-p',
-                '|', 'grep', 'REMOVED_ACCOUNT_ID'
-            ], shell=True, capture_output=True, text=True)
+            result = subprocess.run(
+                ['git', 'rev-list', '--objects', '--all', '--no-object-names',
+                 '--filter=object:type=blob', '--filter-provided-objects', '--stdin'],
+                cwd=self.project_root, input=b''.join(f'^{tip}\n'.encode() for tip in known),
+                capture_output=True
+            )
+        except FileNotFoundError:
+            return []
+        return result.stdout.split()
+    
+    def _scan_history(self, found, stop_at_first):
+        """Add the names of the checks matching blobs in history to found
+        
+        Only history added since the last complete scan is read; findings
+        from that scan are carried over.
+        """
+        tips = self._ref_tips()
+        known = ()
+        cache = self._load_scan_cache()
+        if cache is not None:
+            known, cached = cache
+            found.update(cached)
+        
+        done = threading.Event()
+        if found and (stop_at_first or len(found) == len(HISTORY_CHECKS)):
+            done.set()
+        else:
+            # Large histories are split into slices read by parallel git
+            # processes; the first slice goes to the long-lived one
+            oids = self._history_blobs(known)
+            workers = min(os.cpu_count() or 1, len(oids) // SCAN_SLICE_BLOBS)
+            if workers > 1:
+                size = -(-len(oids) // workers)
+                slices = [oids[i:i + size] for i in range(0, len(oids), size)]
+                procs = [self._cat_file] + [self._start_cat_file() for _ in slices[1:]]
+                with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+                    futures = [executor.submit(self._scan_blobs, found, done, stop_at_first, batch, proc)
+                               for batch, proc in zip(slices, procs)]
+                    complete = [future.result() for future in futures]
+                for proc in procs[1:]:
+                    _stop_process(proc)
+            elif oids:
+                complete = [self._scan_blobs(found, done, stop_at_first, oids, self._cat_file)]
+            else:
+                complete = [True]
             
-            if result.stdout.strip():
-                print("❌ Found real account ID in Git history")
+            # A scan cut short leaves unread output behind
+            if not complete[0]:
+                self.close()
+        
+        # A scan cut short at its first hit may have missed other checks
+        if not done.is_set() or len(found) == len(HISTORY_CHECKS):
+            self._save_scan_cache(tips, found)
+    
+    def _start_cat_file(self):
+        return subprocess.Popen(
+            ['git', 'cat-file', '--batch'],
+            cwd=self.project_root, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, bufsize=1024 * 1024
+        )
+    
+    @cached_property
+    def _cat_file(self):
+        """One `git cat-file --batch` process serving every object lookup"""
+        return self._start_cat_file()
+    
+    def close(self):
+        """Stop the cat-file process, if one was started"""
+        proc = self.__dict__.pop('_cat_file', None)
+        if proc is not None:
+            _stop_process(proc)
+    
+    def __del__(self):
+        self.close()
+    
+    def _read_object(self, oid):
+        """Contents of one object, or None when it does not exist"""
+        proc = self._cat_file
+        proc.stdin.write(f'{oid}\n'.encode())
+        proc.stdin.flush()
+        header = proc.stdout.readline().split()
+        if len(header) != 3:
+            return None
+        return proc.stdout.read(int(header[2]) + 1)[:-1]
+    
+    def _scan_blobs(self, found, done, stop_at_first, oids, proc):
+        """Add the names of the checks matching any of the blobs to found
+        
+        The blobs are read through the cat-file process proc. Stops once done
+        is set by this or another scan. Returns whether every blob was read,
+        leaving proc ready for further lookups.
+        """
+        # IDs are written from another thread, so git never blocks on a full
+        # stdin pipe while its output is not being read
+        feeder = threading.Thread(target=_feed_lines, args=(proc.stdin, oids), daemon=True)
+        feeder.start()
+        
+        for _ in oids:
+            if done.is_set():
+                return False
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                # End of output, or a "<oid> missing" line
+                if not header:
+                    return False
+                continue
+            found.update(_scan_stream(proc.stdout, int(header[2]) + 1))
+            if found and (stop_at_first or len(found) == len(HISTORY_CHECKS)):
+                done.set()
+        feeder.join()
+        return True
+    
+    def check_sensitive_data_in_history(self, stop_at_first=False):
+        """Check if sensitive data exists in Git history
+        
+        Args:
+            stop_at_first: Stop walking history at the first hit, when only
+                a yes/no answer is needed
+        """
+        print("🔍 Checking Git history for sensitive data...")
+        
+        sensitive_found = False
+        
+        # Each blob reachable from any ref is scanned once, however many
+        # commits it appears in, skipping what the last scan read
+        found = set()
+        self._scan_history(found, stop_at_first)
+        
+        for name, _, description in HISTORY_CHECKS:
+            if name in found:
+                print(f"❌ Found {description} in Git history")
                 sensitive_found = True
-        except:
-            pass
         
         if not sensitive_found:
             print("✅ No sensitive data found in Git history")
@@ -173,7 +497,7 @@ echo "⚠️  IMPORTANT: Run 'git push --force' to update remote repository"
         print("=" * 50)
         
         # Check if sensitive data exists in history
-        if self.check_sensitive_data_in_history():
+        if self.check_sensitive_data_in_history(stop_at_first=True):
             print("\n⚠️  SENSITIVE DATA FOUND IN GIT HISTORY")
             print("   Proceeding with cleanup...")
         else:
@@ -198,12 +522,17 @@ echo "⚠️  IMPORTANT: Run 'git push --force' to update remote repository"
             print("   3. Delete backup files")
             
         else:
-            print("\n🔧 Using git filter-branch (alternative)")
+            if self.check_filter_repo_available():
+                print("\n🔧 Using git filter-repo (alternative)")
+            else:
+                print("\n🔧 Using git filter-branch (alternative, slow: install git-filter-repo)")
             
-            # Create git filter-branch script
+            # Create git filter-repo/filter-branch script
             filter_script = self.create_git_filter_script()
+            patterns_file = self.create_sensitive_patterns_file()
             
             print(f"📝 Created filter script: {filter_script}")
+            print(f"📝 Created patterns file: {patterns_file}")
             
             print("\n🚀 To clean Git history:")
             print(f"   1. Run: {filter_script}")
@@ -261,7 +590,10 @@ rm -rf backup-repo
 rm bfg-clean.sh sensitive-patterns.txt
 ```
 
-## Method 2: Git Filter-Branch (Alternative)
+## Method 2: Git Filter-Repo / Filter-Branch (Alternative)
+
+The script uses `git filter-repo` when it is installed (`pip install git-filter-repo`)
+and falls back to the much slower `git filter-branch` otherwise.
 
 ### Cleanup Steps
 ```bash
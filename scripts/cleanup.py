@@ -18,19 +18,27 @@ Usage:
     python scripts/cleanup.py --old-backups
     python scripts/cleanup.py --logs
     python scripts/cleanup.py --s3
+    python scripts/cleanup.py --install-lifecycle
     python scripts/cleanup.py --all
 """
 
 import argparse
+import fnmatch
 import json
 import os
+import re
 import sys
 import shutil
 import glob
-from datetime import datetime, timedelta
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, List, Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 # Add project root to path
@@ -39,6 +47,50 @@ sys.path.append(str(project_root))
 
 from config.config_manager import ConfigManager, ConfigError
 from scripts.logger import SyncLogger
+from scripts.backup import ARCHIVE_SUFFIXES, S3_DELETE_WORKERS, BackupManager, delete_s3_backups
+
+# Files deleted at once by local cleanup
+DELETE_WORKERS = 16
+
+# S3 connections per manager, enough for every DeleteObjects batch in flight
+S3_MAX_POOL_CONNECTIONS = max(32, 2 * S3_DELETE_WORKERS)
+
+# ID of the S3 Lifecycle rule installed by ensure_s3_lifecycle_policy
+LIFECYCLE_RULE_ID = "expire-backups"
+
+# Log files rotated by size, as SyncLogger does (name.log.1), or by date (name.log.2026-01-31)
+ROTATED_LOG_PATTERN = re.compile(r"\.log\.(\d{4}-\d{2}-\d{2}|\d+)$")
+
+# How long counts learned by a scan are reused by get_cleanup_stats
+STATS_CACHE_TTL_SECONDS = 30.0
+
+# Directory mtimes left by temp file sweeps, relative to the project root.
+# Kept in a subdirectory so saving it does not touch the swept root's mtime.
+SWEEP_CACHE_FILE = Path(".cache") / "cleanup-cache.json"
+
+# Directories modified this recently are not recorded as swept: a file
+# created within the same timestamp tick would leave their mtime unchanged
+SWEEP_SETTLE_SECONDS = 2.0
+
+
+@dataclass
+class _TraversalCache:
+    """Cleanup statistics learned by recent directory scans"""
+    counts: Dict[str, int] = field(default_factory=dict)
+    times: Dict[str, float] = field(default_factory=dict)
+    
+    def get(self, key: str) -> Optional[int]:
+        stamp = self.times.get(key)
+        if stamp is None or time.monotonic() - stamp > STATS_CACHE_TTL_SECONDS:
+            return None
+        return self.counts[key]
+    
+    def put(self, key: str, count: int) -> None:
+        self.counts[key] = count
+        self.times[key] = time.monotonic()
+    
+    def invalidate(self, key: str) -> None:
+        self.times.pop(key, None)
 
 
 class CleanupManager:
@@ -63,12 +115,39 @@ class CleanupManager:
             ".DS_Store",
             "Thumbs.db"
         ]
+        
+        # Counts for get_cleanup_stats, also filled in by the cleanup scans
+        self._stats_cache = _TraversalCache()
+        
+        # Directories whose last temp file sweep left no temp files behind
+        self._cache_file = self.project_root / SWEEP_CACHE_FILE
+        self._sweep_cache = self._load_sweep_cache()
+        self._sweep_cache_dirty = False
+    
+    @cached_property
+    def backup_manager(self) -> BackupManager:
+        """Applies backup.py's knowledge of backup archives and incremental chains"""
+        return BackupManager(self.project_root)
+    
+    @cached_property
+    def s3_client(self):
+        """S3 client shared by all S3 cleanup operations of this manager
+        
+        Created on first use, so local-only cleanups never build one, and
+        repeated S3 calls reuse its connection pool.
+        """
+        return boto3.Session().client('s3', config=Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={'max_attempts': 10, 'mode': 'adaptive'}
+        ))
     
-    def cleanup_temp_files(self, dry_run: bool = False) -> Dict[str, Any]:
+    def cleanup_temp_files(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, Any]:
         """Clean up temporary files
         
         Args:
             dry_run: If True, only report what would be cleaned
+            verbose: If True, also list every deleted path in deleted_files;
+                otherwise only deleted_count is kept
             
         Returns:
             Dictionary containing cleanup results
@@ -87,10 +166,13 @@ class CleanupManager:
             for directory in directories_to_clean:
                 dir_path = self.project_root / directory
                 if dir_path.exists():
-                    self._cleanup_directory_temp_files(dir_path, results, dry_run)
+                    self._cleanup_directory_temp_files(dir_path, results, dry_run, verbose)
             
             # Clean up temp files in root project directory
-            self._cleanup_directory_temp_files(self.project_root, results, dry_run)
+            self._cleanup_directory_temp_files(self.project_root, results, dry_run, verbose)
+            if not dry_run:
+                self._stats_cache.invalidate("temp_files")
+            self._save_sweep_cache()
             
             self.logger.log_info(f"Temp file cleanup completed: {results['deleted_count']} files")
             
@@ -101,11 +183,13 @@ class CleanupManager:
         
         return results
     
-    def cleanup_old_backups(self, dry_run: bool = False) -> Dict[str, Any]:
+    def cleanup_old_backups(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, Any]:
         """Clean up old backup files
         
         Args:
             dry_run: If True, only report what would be cleaned
+            verbose: If True, also list every deleted path in deleted_files;
+                otherwise only deleted_count is kept
             
         Returns:
             Dictionary containing cleanup results
@@ -117,25 +201,10 @@ class CleanupManager:
             if not backup_dir.exists():
                 return results
             
-            cutoff_date = datetime.now() - timedelta(days=self.backup_retention_days)
+            expired = self._expired_backups(backup_dir, results["errors"])
             
-            for backup_file in backup_dir.glob("*.tar.gz"):
-                try:
-                    stat = backup_file.stat()
-                    file_date = datetime.fromtimestamp(stat.st_mtime)
-                    
-                    if file_date < cutoff_date:
-                        if not dry_run:
-                            backup_file.unlink()
-                            results["deleted_files"].append(str(backup_file))
-                            results["deleted_count"] += 1
-                            self.logger.log_info(f"Deleted old backup: {backup_file.name}")
-                        else:
-                            results["deleted_files"].append(str(backup_file))
-                            results["deleted_count"] += 1
-                
-                except Exception as e:
-                    results["errors"].append(f"Failed to process {backup_file.name}: {e}")
+            self._delete_files(expired, results, dry_run, self.backup_manager.delete_backup, "old backup", verbose)
+            self._stats_cache.put("old_backups", len(expired) - (0 if dry_run else results["deleted_count"]))
             
             self.logger.log_info(f"Old backup cleanup completed: {results['deleted_count']} files")
             
@@ -146,11 +215,13 @@ class CleanupManager:
         
         return results
     
-    def cleanup_logs(self, dry_run: bool = False) -> Dict[str, Any]:
+    def cleanup_logs(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, Any]:
         """Clean up old log files
         
         Args:
             dry_run: If True, only report what would be cleaned
+            verbose: If True, also list every deleted path in deleted_files;
+                otherwise only deleted_count is kept
             
         Returns:
             Dictionary containing cleanup results
@@ -162,25 +233,10 @@ class CleanupManager:
             if not logs_dir.exists():
                 return results
             
-            cutoff_date = datetime.now() - timedelta(days=self.log_retention_days)
+            expired = self._expired_logs(logs_dir, results["errors"])
             
-            for log_file in logs_dir.glob("*.log"):
-                try:
-                    stat = log_file.stat()
-                    file_date = datetime.fromtimestamp(stat.st_mtime)
-                    
-                    if file_date < cutoff_date:
-                        if not dry_run:
-                            log_file.unlink()
-                            results["deleted_files"].append(str(log_file))
-                            results["deleted_count"] += 1
-                            self.logger.log_info(f"Deleted old log: {log_file.name}")
-                        else:
-                            results["deleted_files"].append(str(log_file))
-                            results["deleted_count"] += 1
-                
-                except Exception as e:
-                    results["errors"].append(f"Failed to process {log_file.name}: {e}")
+            self._delete_files(expired, results, dry_run, Path.unlink, "old log", verbose)
+            self._stats_cache.put("old_logs", len(expired) - (0 if dry_run else results["deleted_count"]))
             
             self.logger.log_info(f"Log cleanup completed: {results['deleted_count']} files")
             
@@ -191,12 +247,33 @@ class CleanupManager:
         
         return results
     
-    def cleanup_s3(self, bucket_name: str = None, dry_run: bool = False) -> Dict[str, Any]:
+    def _expired_logs(self, logs_dir: Path, errors: Optional[List[str]] = None) -> List[Path]:
+        """Log files, current or rotated, last written before the retention period
+        
+        SyncLogger's handlers only expire rotated files of an operation when
+        it runs again, and by count rather than age, so every operation's
+        logs are checked here. Files this process is writing to are left to
+        its own handlers.
+        """
+        cutoff_ts = (datetime.now() - timedelta(days=self.log_retention_days)).timestamp()
+        expired = self._expired_files(logs_dir, (".log",), cutoff_ts, errors, name_pattern=ROTATED_LOG_PATTERN)
+        logs_dir = logs_dir.resolve()
+        active = {
+            Path(handler.baseFilename).name for handler in self.logger.rotation_handlers()
+            if Path(handler.baseFilename).parent.resolve() == logs_dir
+        }
+        return [path for path in expired if path.name not in active]
+    
+    def cleanup_s3(self, bucket_name: str = None, dry_run: bool = False,
+                   store_keys: bool = False) -> Dict[str, Any]:
         """Clean up S3 objects based on lifecycle policies
         
         Args:
             bucket_name: S3 bucket name (optional, uses config if not provided)
             dry_run: If True, only report what would be cleaned
+            store_keys: If True, also list every deleted key in the results;
+                otherwise only the count is kept, so memory stays flat on
+                buckets with millions of expired objects
             
         Returns:
             Dictionary containing cleanup results
@@ -214,41 +291,17 @@ class CleanupManager:
                 results["errors"].append("Invalid bucket name in configuration")
                 return results
             
-            # Initialize S3 client
-            session = boto3.Session()
-            s3 = session.client('s3')
+            s3 = self.s3_client
             
-            # List objects in bucket
-            paginator = s3.get_paginator('list_objects_v2')
-            page_iterator = paginator.paginate(Bucket=bucket_name)
+            # Nothing to scan when S3 expires the backups itself
+            if self._lifecycle_rule_installed(s3, bucket_name):
+                results["lifecycle_delegated"] = True
+                self.logger.log_info(f"S3 cleanup skipped: expiration delegated to S3 lifecycle ({bucket_name})")
+                return results
             
-            cutoff_date = datetime.now() - timedelta(days=self.backup_retention_days)
-            
-            for page in page_iterator:
-                if 'Contents' not in page:
-                    continue
-                
-                for obj in page['Contents']:
-                    key = obj['Key']
-                    last_modified = obj['LastModified']
-                    
-                    # Skip system files and current data
-                    if key.startswith('system/') or not key.startswith('backups/'):
-                        continue
-                    
-                    # Check if object is old enough to delete
-                    if last_modified < cutoff_date:
-                        if not dry_run:
-                            try:
-                                s3.delete_object(Bucket=bucket_name, Key=key)
-                                results["deleted_objects"].append(key)
-                                results["deleted_count"] += 1
-                                self.logger.log_info(f"Deleted S3 object: {key}")
-                            except Exception as e:
-                                results["errors"].append(f"Failed to delete {key}: {e}")
-                        else:
-                            results["deleted_objects"].append(key)
-                            results["deleted_count"] += 1
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.backup_retention_days)
+            delete_s3_backups(s3, bucket_name, cutoff_date, results, self.logger,
+                              dry_run=dry_run, store_keys=store_keys)
             
             self.logger.log_info(f"S3 cleanup completed: {results['deleted_count']} objects")
             
@@ -265,11 +318,93 @@ class CleanupManager:
         
         return results
     
-    def cleanup_restore_directory(self, dry_run: bool = False) -> Dict[str, Any]:
+    def ensure_s3_lifecycle_policy(self, bucket_name: str = None) -> Dict[str, Any]:
+        """Install an S3 Lifecycle rule expiring backups after the retention period
+        
+        S3 then expires backups/ objects itself and cleanup_s3 no longer has
+        to list and delete them. Other lifecycle rules on the bucket are kept;
+        an existing rule with the same ID is replaced.
+        
+        Args:
+            bucket_name: S3 bucket name (optional, uses config if not provided)
+            
+        Returns:
+            Dictionary containing installation results
+        """
+        results = {"success": True, "errors": []}
+        
+        try:
+            if not bucket_name:
+                config = self.config_manager.load_config("aws")
+                bucket_name = config["aws"]["s3"]["bucket_name"]
+            
+            if bucket_name == "your-sync-bucket":
+                results["success"] = False
+                results["errors"].append("Invalid bucket name in configuration")
+                return results
+            
+            s3 = self.s3_client
+            
+            # PutBucketLifecycleConfiguration replaces the whole configuration
+            rules = [rule for rule in self._lifecycle_rules(s3, bucket_name)
+                     if rule.get('ID') != LIFECYCLE_RULE_ID]
+            rules.append({
+                'ID': LIFECYCLE_RULE_ID,
+                'Status': 'Enabled',
+                'Filter': {'Prefix': 'backups/'},
+                'Expiration': {'Days': self.backup_retention_days},
+            })
+            s3.put_bucket_lifecycle_configuration(
+                Bucket=bucket_name,
+                LifecycleConfiguration={'Rules': rules}
+            )
+            self.logger.log_info(f"Installed S3 lifecycle rule {LIFECYCLE_RULE_ID} on {bucket_name}")
+            
+        except NoCredentialsError:
+            results["success"] = False
+            results["errors"].append("AWS credentials not found")
+        except ClientError as e:
+            results["success"] = False
+            results["errors"].append(f"S3 lifecycle error: {e}")
+        except Exception as e:
+            results["success"] = False
+            results["errors"].append(str(e))
+            self.logger.log_error(e, "S3 lifecycle installation failed")
+        
+        return results
+    
+    def _lifecycle_rules(self, s3, bucket_name: str) -> List[Dict[str, Any]]:
+        """Current lifecycle rules of the bucket (empty when it has none)"""
+        try:
+            return s3.get_bucket_lifecycle_configuration(Bucket=bucket_name).get('Rules', [])
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'NoSuchLifecycleConfiguration':
+                return []
+            raise
+    
+    def _lifecycle_rule_installed(self, s3, bucket_name: str) -> bool:
+        """Whether an enabled rule expires backups/ after the retention period"""
+        try:
+            rules = self._lifecycle_rules(s3, bucket_name)
+        except ClientError:
+            # e.g. no permission to read the configuration: scan instead
+            return False
+        
+        return any(
+            rule.get('ID') == LIFECYCLE_RULE_ID
+            and rule.get('Status') == 'Enabled'
+            and rule.get('Filter', {}).get('Prefix') == 'backups/'
+            and rule.get('Expiration', {}).get('Days') == self.backup_retention_days
+            for rule in rules
+        )
+    
+    def cleanup_restore_directory(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, Any]:
         """Clean up restore directory
         
         Args:
             dry_run: If True, only report what would be cleaned
+            verbose: If True, also list every deleted path in deleted_files;
+                otherwise only deleted_count is kept
             
         Returns:
             Dictionary containing cleanup results
@@ -281,28 +416,25 @@ class CleanupManager:
             if not restore_dir.exists():
                 return results
             
-            # Remove all files in restore directory
-            for item in restore_dir.iterdir():
-                try:
-                    if item.is_file():
-                        if not dry_run:
-                            item.unlink()
-                            results["deleted_files"].append(str(item))
-                            results["deleted_count"] += 1
-                        else:
-                            results["deleted_files"].append(str(item))
-                            results["deleted_count"] += 1
-                    elif item.is_dir():
-                        if not dry_run:
-                            shutil.rmtree(item)
-                            results["deleted_files"].append(str(item))
-                            results["deleted_count"] += 1
-                        else:
-                            results["deleted_files"].append(str(item))
-                            results["deleted_count"] += 1
+            # Items are counted from one read of the top level
+            with os.scandir(restore_dir) as entries:
+                items = [Path(entry.path) for entry in entries]
+            
+            if not dry_run:
+                def record_error(function, path, exc_info):
+                    results["errors"].append(f"Failed to delete {path}: {exc_info[1]}")
                 
-                except Exception as e:
-                    results["errors"].append(f"Failed to delete {item.name}: {e}")
+                # Remove the whole tree in one rmtree walk and recreate the
+                # empty directory, instead of an unlink or rmtree per item
+                shutil.rmtree(restore_dir, onerror=record_error)
+                restore_dir.mkdir(parents=True, exist_ok=True)
+                if results["errors"]:
+                    items = [item for item in items if not os.path.lexists(item)]
+                self._stats_cache.invalidate("restore_files")
+            
+            if verbose:
+                results["deleted_files"] = [str(item) for item in items]
+            results["deleted_count"] = len(items)
             
             self.logger.log_info(f"Restore directory cleanup completed: {results['deleted_count']} items")
             
@@ -313,21 +445,23 @@ class CleanupManager:
         
         return results
     
-    def cleanup_all(self, dry_run: bool = False) -> Dict[str, Any]:
+    def cleanup_all(self, dry_run: bool = False, verbose: bool = False) -> Dict[str, Any]:
         """Run all cleanup operations
         
         Args:
             dry_run: If True, only report what would be cleaned
+            verbose: If True, also list every deleted path in deleted_files;
+                otherwise only deleted_count is kept
             
         Returns:
             Dictionary containing cleanup results
         """
         results = {
-            "temp_files": self.cleanup_temp_files(dry_run),
-            "old_backups": self.cleanup_old_backups(dry_run),
-            "logs": self.cleanup_logs(dry_run),
-            "s3": self.cleanup_s3(dry_run=dry_run),
-            "restore_dir": self.cleanup_restore_directory(dry_run)
+            "temp_files": self.cleanup_temp_files(dry_run, verbose),
+            "old_backups": self.cleanup_old_backups(dry_run, verbose),
+            "logs": self.cleanup_logs(dry_run, verbose),
+            "s3": self.cleanup_s3(dry_run=dry_run, store_keys=verbose),
+            "restore_dir": self.cleanup_restore_directory(dry_run, verbose)
         }
         
         # Calculate totals
@@ -357,64 +491,228 @@ class CleanupManager:
         
         return stats
     
-    def _cleanup_directory_temp_files(self, directory: Path, results: Dict[str, Any], dry_run: bool) -> None:
-        """Clean up temp files in a specific directory"""
+    def _cleanup_directory_temp_files(self, directory: Path, results: Dict[str, Any], dry_run: bool,
+                                      verbose: bool = False) -> None:
+        """Clean up temp files in a specific directory
+        
+        Creating, removing or renaming an entry changes the directory's
+        mtime, so a directory still at the mtime of a sweep that left no temp
+        files behind has none now and is not read again.
+        """
+        swept = self._swept_directories()
+        key = str(directory)
+        mtime_ns = directory.stat().st_mtime_ns
+        if swept.get(key) == mtime_ns:
+            return
+        
+        # One directory read checks every pattern, instead of a glob per pattern
+        is_temp_name = self._temp_name_matcher()
+        with os.scandir(directory) as entries:
+            candidates = [
+                Path(entry.path) for entry in entries
+                if is_temp_name(entry.name) and not entry.is_dir(follow_symlinks=False)
+            ]
+        self._delete_files(candidates, results, dry_run, verbose=verbose)
+        
+        # Deleting changes the mtime again, so a directory that had temp
+        # files is only recorded once a later sweep finds it clean
+        if candidates or time.time() - mtime_ns / 1e9 < SWEEP_SETTLE_SECONDS:
+            swept.pop(key, None)
+        else:
+            swept[key] = mtime_ns
+        self._sweep_cache_dirty = True
+    
+    def _swept_directories(self) -> Dict[str, int]:
+        """Swept directory mtimes, dropped when temp_file_patterns changed"""
+        if self._sweep_cache.get("patterns") != self.temp_file_patterns:
+            self._sweep_cache = {"patterns": list(self.temp_file_patterns), "directories": {}}
+            self._sweep_cache_dirty = True
+        return self._sweep_cache["directories"]
+    
+    def _load_sweep_cache(self) -> Dict[str, Any]:
+        """Directory mtimes saved by earlier temp file sweeps"""
+        try:
+            with open(self._cache_file, "r") as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and isinstance(cache.get("directories"), dict):
+                return cache
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            # A corrupt cache only costs one full sweep; start empty
+            self.logger.log_warning(f"Ignoring unreadable cleanup cache {self._cache_file}: {e}")
+        return {}
+    
+    def _save_sweep_cache(self) -> None:
+        """Write the swept directory mtimes atomically, if they changed"""
+        if not self._sweep_cache_dirty:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._cache_file.with_name(self._cache_file.name + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(self._sweep_cache, f)
+            os.replace(tmp, self._cache_file)
+            self._sweep_cache_dirty = False
+        except OSError as e:
+            self.logger.log_warning(f"Could not save cleanup cache {self._cache_file}: {e}")
+    
+    def _temp_name_matcher(self) -> Callable[[str], bool]:
+        """Predicate telling whether a file name matches temp_file_patterns
+        
+        Plain names, "*suffix" and "prefix*" patterns become set lookups and
+        single endswith/startswith calls; anything else goes through fnmatch.
+        """
+        exact, suffixes, prefixes, others = set(), [], [], []
         for pattern in self.temp_file_patterns:
-            for temp_file in directory.glob(pattern):
+            if not any(char in pattern for char in "*?["):
+                exact.add(pattern)
+            elif pattern.startswith("*") and not any(char in pattern[1:] for char in "*?["):
+                suffixes.append(pattern[1:])
+            elif pattern.endswith("*") and not any(char in pattern[:-1] for char in "*?["):
+                prefixes.append(pattern[:-1])
+            else:
+                others.append(fnmatch.translate(pattern))
+        suffixes, prefixes = tuple(suffixes), tuple(prefixes)
+        other = re.compile("|".join(others)).match if others else None
+        
+        def is_temp_name(name: str) -> bool:
+            return (name in exact or name.endswith(suffixes) or name.startswith(prefixes)
+                    or (other is not None and other(name) is not None))
+        
+        return is_temp_name
+    
+    def _delete_files(self, paths: List[Path], results: Dict[str, Any], dry_run: bool,
+                      delete: Callable[[Path], None] = Path.unlink, label: Optional[str] = None,
+                      verbose: bool = False) -> None:
+        """Delete paths concurrently and record them in results
+        
+        Unlinks are independent filesystem metadata operations, so several
+        run at once. A file that disappeared in the meantime is skipped.
+        
+        Args:
+            paths: Files to delete
+            results: Cleanup results to update
+            dry_run: If True, only record the files
+            delete: Deletes one file
+            label: Logged for each deleted file, when given
+            verbose: If True, also list the deleted files in results
+        """
+        if dry_run:
+            if verbose:
+                results["deleted_files"].extend(str(path) for path in paths)
+            results["deleted_count"] += len(paths)
+            return
+        if not paths:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(paths))) as executor:
+            futures = {executor.submit(delete, path): path for path in paths}
+            for future in as_completed(futures):
+                path = futures[future]
                 try:
-                    if not dry_run:
-                        temp_file.unlink()
-                        results["deleted_files"].append(str(temp_file))
-                        results["deleted_count"] += 1
-                    else:
-                        results["deleted_files"].append(str(temp_file))
-                        results["deleted_count"] += 1
+                    future.result()
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
-                    results["errors"].append(f"Failed to delete {temp_file.name}: {e}")
+                    results["errors"].append(f"Failed to delete {path.name}: {e}")
+                    continue
+                if verbose:
+                    results["deleted_files"].append(str(path))
+                results["deleted_count"] += 1
+                if label:
+                    self.logger.log_info(f"Deleted {label}: {path.name}")
+    
+    def _expired_backups(self, backup_dir: Path, errors: Optional[List[str]] = None) -> List[Path]:
+        """Backup archives past the retention period that can be deleted
+        
+        Archives of an incremental chain that still has a newer, unexpired
+        level are kept, or that level could no longer be restored.
+        """
+        cutoff_ts = (datetime.now() - timedelta(days=self.backup_retention_days)).timestamp()
+        expired = self._expired_files(backup_dir, ARCHIVE_SUFFIXES, cutoff_ts, errors)
+        if not expired:
+            return expired
+        expired_set = set(expired)
+        kept = [archive for archive in self.backup_manager.backup_archives(backup_dir) if archive not in expired_set]
+        return self.backup_manager.outside_kept_chains(expired, kept)
     
     def _count_temp_files(self) -> int:
         """Count temporary files in project"""
+        count = self._stats_cache.get("temp_files")
+        if count is not None:
+            return count
+        
+        # One walk checks every pattern, instead of an rglob per pattern
+        is_temp_name = self._temp_name_matcher()
         count = 0
-        for pattern in self.temp_file_patterns:
-            for file_path in self.project_root.rglob(pattern):
-                if file_path.is_file():
-                    count += 1
+        for _, _, filenames in os.walk(self.project_root):
+            count += sum(1 for name in filenames if is_temp_name(name))
+        
+        self._stats_cache.put("temp_files", count)
         return count
     
+    def _expired_files(self, directory: Path, suffixes: tuple, cutoff_ts: float,
+                       errors: Optional[List[str]] = None,
+                       name_pattern: Optional[re.Pattern] = None) -> List[Path]:
+        """Files in directory ending in one of suffixes, last modified before cutoff_ts
+        
+        The directory is read once and each file's mtime is compared as a raw
+        POSIX timestamp, from the stat of its scandir entry.
+        
+        Args:
+            errors: Collects files that could not be checked, when given
+            name_pattern: Also matches file names that do not end in suffixes
+        """
+        expired = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(suffixes) and not (name_pattern and name_pattern.search(entry.name)):
+                    continue
+                try:
+                    if entry.is_dir():
+                        continue
+                    if entry.stat().st_mtime < cutoff_ts:
+                        expired.append(Path(entry.path))
+                except OSError as e:
+                    if errors is not None:
+                        errors.append(f"Failed to process {entry.name}: {e}")
+        return expired
+    
     def _count_old_backups(self) -> int:
         """Count old backup files"""
+        count = self._stats_cache.get("old_backups")
+        if count is not None:
+            return count
+        
         count = 0
         backup_dir = self.project_root / "backups"
         if backup_dir.exists():
-            cutoff_date = datetime.now() - timedelta(days=self.backup_retention_days)
-            for backup_file in backup_dir.glob("*.tar.gz"):
-                try:
-                    stat = backup_file.stat()
-                    file_date = datetime.fromtimestamp(stat.st_mtime)
-                    if file_date < cutoff_date:
-                        count += 1
-                except Exception:
-                    pass
+            count = len(self._expired_backups(backup_dir))
+        
+        self._stats_cache.put("old_backups", count)
         return count
     
     def _count_old_logs(self) -> int:
         """Count old log files"""
+        count = self._stats_cache.get("old_logs")
+        if count is not None:
+            return count
+        
         count = 0
         logs_dir = self.project_root / "logs"
         if logs_dir.exists():
-            cutoff_date = datetime.now() - timedelta(days=self.log_retention_days)
-            for log_file in logs_dir.glob("*.log"):
-                try:
-                    stat = log_file.stat()
-                    file_date = datetime.fromtimestamp(stat.st_mtime)
-                    if file_date < cutoff_date:
-                        count += 1
-                except Exception:
-                    pass
+            count = len(self._expired_logs(logs_dir))
+        
+        self._stats_cache.put("old_logs", count)
         return count
     
     def _count_restore_files(self) -> int:
         """Count files in restore directory"""
+        count = self._stats_cache.get("restore_files")
+        if count is not None:
+            return count
+        
         count = 0
         restore_dir = self.project_root / "restore"
         if restore_dir.exists():
@@ -423,8 +721,15 @@ class CleanupManager:
                     count += 1
                 elif item.is_dir():
                     count += len(list(item.rglob("*")))
+        
+        self._stats_cache.put("restore_files", count)
         return count
 
+def _print_cleaned(items: List[str], indent: str = "  ") -> None:
+    """List cleaned files or objects (only collected with --verbose)"""
+    for item in items:
+        print(f"{indent}- {item}")
+
 
 def main():
     """Main cleanup function"""
@@ -438,6 +743,9 @@ def main():
     parser.add_argument("--stats", action="store_true", help="Show cleanup statistics")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be cleaned without actually cleaning")
     parser.add_argument("--bucket", type=str, help="S3 bucket name for cleanup")
+    parser.add_argument("--install-lifecycle", action="store_true",
+                        help="Install an S3 lifecycle rule that expires old backups")
+    parser.add_argument("--verbose", action="store_true", help="List every cleaned file or object")
     
     args = parser.parse_args()
     
@@ -453,47 +761,60 @@ def main():
     
     elif args.temp_files:
         print("🧹 Cleaning up temporary files...")
-        results = cleanup_manager.cleanup_temp_files(args.dry_run)
+        results = cleanup_manager.cleanup_temp_files(args.dry_run, args.verbose)
         if results["success"]:
             print(f"✅ Temp file cleanup completed: {results['deleted_count']} files")
+            _print_cleaned(results["deleted_files"])
         else:
             print(f"❌ Temp file cleanup failed: {results['errors']}")
     
     elif args.old_backups:
         print("🗑️ Cleaning up old backups...")
-        results = cleanup_manager.cleanup_old_backups(args.dry_run)
+        results = cleanup_manager.cleanup_old_backups(args.dry_run, args.verbose)
         if results["success"]:
             print(f"✅ Old backup cleanup completed: {results['deleted_count']} files")
+            _print_cleaned(results["deleted_files"])
         else:
             print(f"❌ Old backup cleanup failed: {results['errors']}")
     
     elif args.logs:
         print("📋 Cleaning up old logs...")
-        results = cleanup_manager.cleanup_logs(args.dry_run)
+        results = cleanup_manager.cleanup_logs(args.dry_run, args.verbose)
         if results["success"]:
             print(f"✅ Log cleanup completed: {results['deleted_count']} files")
+            _print_cleaned(results["deleted_files"])
         else:
             print(f"❌ Log cleanup failed: {results['errors']}")
     
     elif args.s3:
         print("☁️ Cleaning up S3 objects...")
-        results = cleanup_manager.cleanup_s3(args.bucket, args.dry_run)
+        results = cleanup_manager.cleanup_s3(args.bucket, args.dry_run, store_keys=args.verbose)
         if results["success"]:
             print(f"✅ S3 cleanup completed: {results['deleted_count']} objects")
+            _print_cleaned(results["deleted_objects"])
         else:
             print(f"❌ S3 cleanup failed: {results['errors']}")
     
+    elif args.install_lifecycle:
+        print("☁️ Installing S3 lifecycle rule for backups...")
+        results = cleanup_manager.ensure_s3_lifecycle_policy(args.bucket)
+        if results["success"]:
+            print(f"✅ Backups now expire after {cleanup_manager.backup_retention_days} days")
+        else:
+            print(f"❌ Lifecycle rule installation failed: {results['errors']}")
+    
     elif args.restore_dir:
         print("🔄 Cleaning up restore directory...")
-        results = cleanup_manager.cleanup_restore_directory(args.dry_run)
+        results = cleanup_manager.cleanup_restore_directory(args.dry_run, args.verbose)
         if results["success"]:
             print(f"✅ Restore directory cleanup completed: {results['deleted_count']} files")
+            _print_cleaned(results["deleted_files"])
         else:
             print(f"❌ Restore directory cleanup failed: {results['errors']}")
     
     elif args.all:
         print("🧹 Running all cleanup operations...")
-        results = cleanup_manager.cleanup_all(args.dry_run)
+        results = cleanup_manager.cleanup_all(args.dry_run, args.verbose)
         
         summary = results["summary"]
         if summary["all_successful"]:
@@ -506,6 +827,7 @@ def main():
             if operation != "summary":
                 status = "✅" if result.get("success", False) else "❌"
                 print(f"  {status} {operation}: {result.get('deleted_count', 0)} items")
+                _print_cleaned(result.get("deleted_files", result.get("deleted_objects", [])), "    ")
     
     else:
         parser.print_help()
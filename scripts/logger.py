@@ -29,9 +29,7 @@ import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from typing import Dict, Any, List, Optional
 
 class SyncLogger:
     """Structured logger for sync operations with CloudWatch integration"""
@@ -131,8 +129,19 @@ class SyncLogger:
         error_handler.setFormatter(JSONFormatter(self.operation_name))
         self.logger.addHandler(error_handler)
     
+    def rotation_handlers(self) -> List[logging.handlers.BaseRotatingHandler]:
+        """Handlers rotating this logger's log files, by size or by time"""
+        return [
+            handler for handler in self.logger.handlers
+            if isinstance(handler, logging.handlers.BaseRotatingHandler)
+        ]
+    
     def _setup_cloudwatch(self):
         """Initialize CloudWatch logging client"""
+        # Imported here so scripts that never log to CloudWatch skip boto3's import cost
+        import boto3
+        from botocore.exceptions import ClientError, NoCredentialsError
+        
         try:
             session = boto3.Session()
             self.cloudwatch_logs = session.client('logs')
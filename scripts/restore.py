@@ -27,6 +27,7 @@ import sys
 import shutil
 import hashlib
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import boto3
@@ -38,6 +39,7 @@ sys.path.append(str(project_root))
 
 from config.config_manager import ConfigManager, ConfigError
 from scripts.logger import SyncLogger
+from scripts.backup import ARCHIVE_SUFFIXES, BackupManager
 
 
 class RestoreManager:
@@ -57,6 +59,11 @@ class RestoreManager:
         self.verify_checksums = True
         self.overwrite_existing = False
     
+    @cached_property
+    def backup_manager(self) -> BackupManager:
+        """Reads backup archives, and their incremental chains, as backup.py writes them"""
+        return BackupManager(self.project_root)
+    
     def restore_from_s3(self, bucket_name: str = None, prefix: str = None, 
                        date_filter: str = None) -> Dict[str, Any]:
         """Restore data from S3
@@ -174,44 +181,44 @@ class RestoreManager:
             temp_restore_dir = self.restore_dir / f"temp_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             temp_restore_dir.mkdir(exist_ok=True)
             
-            # Extract backup
-            if backup_file.suffix == '.tar.gz':
-                import tarfile
-                with tarfile.open(backup_file, 'r:gz') as tar:
-                    tar.extractall(temp_restore_dir)
-            else:
-                results["success"] = False
-                results["errors"].append(f"Unsupported backup format: {backup_file.suffix}")
-                return results
-            
-            # Read manifest
-            manifest_path = temp_restore_dir / "manifest.json"
-            if manifest_path.exists():
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
-                
-                backup_type = manifest.get("backup_type", "unknown")
-                self.logger.log_info(f"Restoring {backup_type} backup")
-                
-                if restore_type == "auto":
-                    restore_type = backup_type
-                
-                # Perform restore based on type
-                if restore_type in ["config", "all"]:
-                    self._restore_config_from_backup(temp_restore_dir, results)
-                
-                if restore_type in ["data", "all"]:
-                    self._restore_data_from_backup(temp_restore_dir, results)
-                
-                if restore_type in ["logs", "all"]:
-                    self._restore_logs_from_backup(temp_restore_dir, results)
+            # The extraction is thrown away whether or not the restore succeeds
+            try:
+                # Extract backup
+                if backup_file.name.endswith(ARCHIVE_SUFFIXES):
+                    self.backup_manager.extract_archive(backup_file, temp_restore_dir)
+                else:
+                    results["success"] = False
+                    results["errors"].append(f"Unsupported backup format: {backup_file.suffix}")
+                    return results
                 
-            else:
-                results["success"] = False
-                results["errors"].append("Backup manifest not found")
-            
-            # Clean up temporary directory
-            shutil.rmtree(temp_restore_dir)
+                # Read manifest
+                manifest_path = temp_restore_dir / "manifest.json"
+                if manifest_path.exists():
+                    with open(manifest_path, 'r') as f:
+                        manifest = json.load(f)
+                    
+                    backup_type = manifest.get("backup_type", "unknown")
+                    self.logger.log_info(f"Restoring {backup_type} backup")
+                    
+                    if restore_type == "auto":
+                        # Local backups hold config, logs and data alike
+                        restore_type = "all" if backup_type == "local" else backup_type
+                    
+                    # Perform restore based on type
+                    if restore_type in ["config", "all"]:
+                        self._restore_config_from_backup(temp_restore_dir, results)
+                    
+                    if restore_type in ["data", "all"]:
+                        self._restore_data_from_backup(temp_restore_dir, results)
+                    
+                    if restore_type in ["logs", "all"]:
+                        self._restore_logs_from_backup(temp_restore_dir, results)
+                    
+                else:
+                    results["success"] = False
+                    results["errors"].append("Backup manifest not found")
+            finally:
+                shutil.rmtree(temp_restore_dir, ignore_errors=True)
             
         except Exception as e:
             results["success"] = False
@@ -231,7 +238,9 @@ class RestoreManager:
         try:
             # Find latest config backup
             backup_dir = self.project_root / "backups"
-            config_backups = list(backup_dir.glob("config_backup_*.tar.gz"))
+            config_backups = [
+                path for suffix in ARCHIVE_SUFFIXES for path in backup_dir.glob(f"config_backup_*{suffix}")
+            ]
             
             if not config_backups:
                 results["success"] = False
@@ -331,7 +340,7 @@ class RestoreManager:
         try:
             # Check local backups
             backup_dir = self.project_root / "backups"
-            for backup_file in backup_dir.glob("*.tar.gz"):
+            for backup_file in (p for suffix in ARCHIVE_SUFFIXES for p in backup_dir.glob(f"*{suffix}")):
                 try:
                     stat = backup_file.stat()
                     restore_info = {
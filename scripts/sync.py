@@ -8,8 +8,10 @@ Also provides a backward-compatible `S3Sync` class shim for legacy tests and scr
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import logging
+import mmap
 import os
 import sys
 from datetime import datetime
@@ -30,17 +32,73 @@ except ImportError:
 
 try:
     # Prefer refactored engine if available
-    from core.sync_engine import SyncEngine, EngineConfig, FileToSync
+    from core.sync_engine import SyncEngine, EngineConfig, FileToSync, _map_settled
 except Exception:  # pragma: no cover - fallback if core not present
     SyncEngine = None  # type: ignore
     EngineConfig = None  # type: ignore
     FileToSync = None  # type: ignore
+    _map_settled = None  # type: ignore
 
 
 # Minimal placeholder to satisfy tests that patch this symbol
 AWSIdentityVerifier = object
 
 
+class _MappedPart(io.RawIOBase):
+    """Seekable read-only file object over a slice of an mmap.
+
+    botocore rejects a bare memoryview as Body but accepts any file object
+    it can read, seek and tell, so a part can be sent (and re-sent on retry)
+    from the page cache. Each read() copies only what it returns; the part's
+    pages are never held in memory as a whole.
+    """
+
+    def __init__(self, mapping: mmap.mmap, offset: int, size: int):
+        super().__init__()
+        self._view = memoryview(mapping)[offset:offset + size]
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        if end <= self._pos:
+            return b""
+        data = self._view[self._pos:end].tobytes()
+        self._pos = end
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # Drop the export so the mmap itself can be closed
+        self._view.release()
+        super().close()
+
+
 class S3Sync:
     """Backward-compatible sync shim that delegates to the refactored engine.
 
@@ -164,9 +222,16 @@ class S3Sync:
         else:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    h.update(chunk)
+            # 1 MiB reads into a reused buffer; hashlib releases the GIL for
+            # large updates, so upload threads keep running while we hash
+            with open(file_path, "rb", buffering=0) as f:
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    h.update(view[:n])
             return h.hexdigest()
         except FileNotFoundError:
             return None
@@ -271,25 +336,40 @@ class S3Sync:
         try:
             mpu = self._retry_with_backoff(create)
             parts = []
-            part_number = 1
             with open(local_file, "rb") as f:
-                while True:
-                    data = f.read(chunk_size)
-                    if not data:
-                        break
+                # Parts are views into one read-only mapping of the file, so no
+                # part is held in memory and a retry re-sends the same pages.
+                # Files that may still be changing are not mapped (a truncation
+                # under the mapping raises SIGBUS); their parts are read instead
+                mapping = _map_settled(f) if _map_settled is not None else None
+                if mapping is not None and len(mapping) != file_size:
+                    mapping.close()
+                    mapping = None
+
+                def part_body(offset: int) -> io.RawIOBase:
+                    if mapping is not None:
+                        return _MappedPart(mapping, offset, chunk_size)
+                    f.seek(offset)
+                    return io.BytesIO(f.read(chunk_size))
 
-                    def upload_part():
-                        return self.s3_client.upload_part(
-                            Bucket=self.bucket_name,
-                            Key=s3_key,
-                            PartNumber=part_number,
-                            UploadId=mpu["UploadId"],
-                            Body=data,
-                        )
-
-                    r = self._retry_with_backoff(upload_part)
-                    parts.append({"ETag": r["ETag"], "PartNumber": part_number})
-                    part_number += 1
+                try:
+                    for part_number, offset in enumerate(range(0, file_size, chunk_size), 1):
+
+                        def upload_part():
+                            with part_body(offset) as body:
+                                return self.s3_client.upload_part(
+                                    Bucket=self.bucket_name,
+                                    Key=s3_key,
+                                    PartNumber=part_number,
+                                    UploadId=mpu["UploadId"],
+                                    Body=body,
+                                )
+
+                        r = self._retry_with_backoff(upload_part)
+                        parts.append({"ETag": r["ETag"], "PartNumber": part_number})
+                finally:
+                    if mapping is not None:
+                        mapping.close()
 
             def complete():
                 return self.s3_client.complete_multipart_upload(
@@ -438,7 +518,10 @@ def main():
         max_concurrent_checks=args.max_concurrent_checks,
     )
     app = SyncTUI(opts)
-    rc = app.run()
+    try:
+        rc = app.run()
+    finally:
+        app.engine.close()
     sys.exit(rc)
 
 
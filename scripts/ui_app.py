@@ -20,7 +20,7 @@ from botocore.exceptions import ClientError
 from core.config_loader import load_config
 from core.smoothing import exponential_moving_average
 from core.sync_engine import SyncEngine, EngineConfig, FileToSync
-from core.auto_tune import SystemSnapshot, estimate_worker_counts
+from core.auto_tune import current_snapshot, estimate_worker_counts
 from tui.dashboard import FullScreenDashboard, DashboardLogHandler
 from scripts.logger import SyncLogger
 # Identity will be fetched directly via STS to avoid extra noise
@@ -49,15 +49,8 @@ class SyncTUI:
         s3_cfg = self.config.get("s3", {})
 
         # Auto-tune workers if user passes 0 via CLI (or config later)
-        cpu_count = os.cpu_count() or 1
-        try:
-            import psutil as _ps  # type: ignore  # reuse if available
-        except Exception:  # pragma: no cover
-            _ps = None  # type: ignore
-        total_mem = getattr(_ps.virtual_memory(), 'total', None) if _ps else None
-        avail_mem = getattr(_ps.virtual_memory(), 'available', None) if _ps else None
         chunk_size_mb = sync_cfg.get("chunk_size_mb", 100)
-        sys_snap = SystemSnapshot(cpu_count_logical=cpu_count, total_memory_bytes=total_mem, available_memory_bytes=avail_mem)
+        sys_snap = current_snapshot()
         # CLI value 0 triggers estimation; otherwise use provided value
         cli_uploads = int(getattr(options, 'max_concurrent_uploads', 20) or 20)
         cli_checks = int(getattr(options, 'max_concurrent_checks', 20) or 20)
@@ -69,20 +62,10 @@ class SyncTUI:
                 options.max_concurrent_checks = est_checks
 
         # Auto-tune workers by default; explicit CLI values override
-        cpu_count = os.cpu_count() or 1
-        try:
-            import psutil as _ps  # type: ignore  # reuse if available
-        except Exception:  # pragma: no cover
-            _ps = None  # type: ignore
-        mem_info = _ps.virtual_memory() if _ps else None
-        total_mem = getattr(mem_info, 'total', None)
-        avail_mem = getattr(mem_info, 'available', None)
-        chunk_size_mb = sync_cfg.get("chunk_size_mb", 100)
-        sys_snap = SystemSnapshot(
-            cpu_count_logical=cpu_count,
-            total_memory_bytes=total_mem,
-            available_memory_bytes=avail_mem,
-        )
+        sys_snap = current_snapshot()
+        cpu_count = sys_snap.cpu_count_logical
+        total_mem = sys_snap.total_memory_bytes
+        avail_mem = sys_snap.available_memory_bytes
         cli_uploads = int(getattr(options, 'max_concurrent_uploads', 0) or 0)
         cli_checks = int(getattr(options, 'max_concurrent_checks', 0) or 0)
         if cli_uploads > 0 and cli_checks > 0:
@@ -114,6 +97,7 @@ class SyncTUI:
                 exclude_patterns=sync_cfg.get("exclude_patterns", []),
                 max_concurrent_uploads=chosen_uploads,
                 max_concurrent_checks=chosen_checks,
+                hash_cache_path=self.project_root / ".cache" / "hash-cache.json",
             )
         )
         self.console = FullScreenDashboard()
@@ -552,15 +536,10 @@ class SyncTUI:
 
         # Discover
         discover_start = datetime.now()
-        all_candidates = self.engine.discover_all_files()
+        all_candidates = self.engine.discover_batch()
         total_all = len(all_candidates)
-        # Determine total bytes across all discovered files
-        total_bytes_all = 0
-        for it in all_candidates:
-            try:
-                total_bytes_all += it.local_path.stat().st_size
-            except Exception:
-                pass
+        # Sizes were collected during discovery
+        total_bytes_all = sum(all_candidates.sizes)
         elapsed_discover = (datetime.now() - discover_start).total_seconds()
         rate = total_all / elapsed_discover if elapsed_discover > 0 else 0.0
         self.console.set_discovery([f"Files found: {total_all}", f"Elapsed: {elapsed_discover:.1f}s  Rate: {rate:.1f} files/s"], percent=100.0)
@@ -739,7 +718,11 @@ def main():
         max_concurrent_checks=args.max_concurrent_checks,
     )
     app = SyncTUI(opts)
-    sys.exit(app.run())
+    try:
+        rc = app.run()
+    finally:
+        app.engine.close()
+    sys.exit(rc)
 
 
 if __name__ == "__main__":
@@ -30,3 +30,25 @@ def test_estimate_worker_counts_tuple():
     assert up >= 1 and chk >= 1
 
 
+def test_current_snapshot_reuses_recent_probe(monkeypatch):
+    import core.auto_tune as auto_tune
+
+    calls = []
+
+    class _FakePsutil:
+        @staticmethod
+        def virtual_memory():
+            calls.append(1)
+            return type("VM", (), {"total": 8 * 1024**3, "available": 4 * 1024**3})()
+
+    monkeypatch.setattr(auto_tune, "psutil", _FakePsutil)
+    monkeypatch.setattr(auto_tune, "_snapshot_cache", None)
+
+    first = auto_tune.current_snapshot()
+    second = auto_tune.current_snapshot()
+    assert first is second
+    assert len(calls) == 1
+    assert first.available_memory_bytes == 4 * 1024**3
+
+    auto_tune.current_snapshot(max_age_seconds=0)
+    assert len(calls) == 2
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for the Git history scan in scripts/clean-git-history.py
+
+The scans run against scratch repositories created with the git binary.
+"""
+
+import importlib.util
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+spec = importlib.util.spec_from_file_location(
+    "clean_git_history", str(Path(__file__).parent.parent / "scripts" / "clean-git-history.py")
+)
+clean_git_history = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(clean_git_history)
+GitHistoryCleaner = clean_git_history.GitHistoryCleaner
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+
+SECRET = b"REMOVED_ACCOUNT_ID"
+
+
+def _git(repo, *args):
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True
+    )
+    return result.stdout.decode().strip()
+
+
+def _commit(repo, files, message="commit"):
+    for name, content in files.items():
+        (repo / name).write_bytes(content)
+    _git(repo, "add", *files)
+    _git(repo, "commit", "-q", "--allow-empty", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    return tmp_path
+
+
+@pytest.fixture
+def cleaner(repo):
+    cleaner = GitHistoryCleaner()
+    cleaner.project_root = repo
+    yield cleaner
+    cleaner.close()
+
+
+def _scanned_blobs(cleaner):
+    """Patch cleaner to record the blob IDs each scan reads"""
+    scanned = []
+    scan_blobs = cleaner._scan_blobs
+
+    def record(found, done, stop_at_first, oids, proc):
+        scanned.extend(oids)
+        return scan_blobs(found, done, stop_at_first, oids, proc)
+
+    return scanned, patch.object(cleaner, "_scan_blobs", side_effect=record)
+
+
+def test_scan_cache_reused_for_new_commits(repo, cleaner):
+    _commit(repo, {"a.txt": SECRET})
+    assert cleaner.check_sensitive_data_in_history() is True
+    assert (repo / clean_git_history.SCAN_CACHE_FILE).exists()
+
+    _commit(repo, {"b.txt": b"clean"})
+    scanned, spy = _scanned_blobs(cleaner)
+    with spy:
+        assert cleaner.check_sensitive_data_in_history() is True
+
+    assert [oid.decode() for oid in scanned] == [_git(repo, "rev-parse", "HEAD:b.txt")]
+
+
+def test_scan_cache_dropped_after_history_rewrite(repo, cleaner):
+    _commit(repo, {"a.txt": b"clean"})
+    _commit(repo, {"b.txt": SECRET})
+    assert cleaner.check_sensitive_data_in_history() is True
+
+    _git(repo, "rm", "-q", "b.txt")
+    _git(repo, "commit", "-q", "--amend", "--allow-empty", "-m", "rewritten")
+
+    assert cleaner.check_sensitive_data_in_history() is False
+
+
+def test_scan_cache_dropped_when_checks_change(repo, cleaner, monkeypatch):
+    _commit(repo, {"a.txt": b"clean"})
+    assert cleaner.check_sensitive_data_in_history() is False
+
+    monkeypatch.setattr(
+        clean_git_history, "HISTORY_CHECKS",
+        clean_git_history.HISTORY_CHECKS + [("extra", "EXTRA", "extra check")]
+    )
+    scanned, spy = _scanned_blobs(cleaner)
+    with spy:
+        cleaner.check_sensitive_data_in_history()
+
+    assert [oid.decode() for oid in scanned] == [_git(repo, "rev-parse", "HEAD:a.txt")]
+
+
+def test_match_straddling_scan_chunks_is_found(repo, cleaner, monkeypatch):
+    monkeypatch.setattr(clean_git_history, "SCAN_CHUNK_BYTES", 1024)
+    _commit(repo, {"big.bin": b"x" * 1020 + SECRET + b"y" * 4096})
+
+    assert cleaner.check_sensitive_data_in_history() is True
+
+
+@pytest.mark.parametrize("slice_blobs", [5000, 2])
+def test_stop_at_first_leaves_no_cache_or_process(repo, cleaner, monkeypatch, slice_blobs):
+    monkeypatch.setattr(clean_git_history, "SCAN_SLICE_BLOBS", slice_blobs)
+    monkeypatch.setattr(clean_git_history.os, "cpu_count", lambda: 4)
+    _commit(repo, {f"clean_{i}.txt": f"clean {i}".encode() for i in range(12)})
+    _commit(repo, {"secret.txt": SECRET})
+
+    started = []
+    start_cat_file = cleaner._start_cat_file
+
+    def record():
+        proc = start_cat_file()
+        started.append(proc)
+        return proc
+
+    with patch.object(cleaner, "_start_cat_file", side_effect=record):
+        assert cleaner.check_sensitive_data_in_history(stop_at_first=True) is True
+
+    assert not (repo / clean_git_history.SCAN_CACHE_FILE).exists()
+    # Only a cat-file process left ready for further lookups may still run
+    live = cleaner.__dict__.get("_cat_file")
+    assert all(proc.poll() is not None for proc in started if proc is not live)
+    if live is not None:
+        assert cleaner._read_object(_git(repo, "rev-parse", "HEAD:secret.txt")) == SECRET
@@ -145,6 +145,31 @@ class TestConfigManager:
         assert "aws" not in config
         assert config["sync"]["sync_settings"]["mode"] == "incremental"
     
+    def test_schemas_shared_and_read_only(self, config_manager, temp_config_dir):
+        """Test that schemas and validators are shared and cannot be mutated"""
+        other = ConfigManager(temp_config_dir)
+
+        assert other.aws_schema is config_manager.aws_schema
+        assert other._sync_validator is config_manager._sync_validator
+        with pytest.raises(TypeError):
+            config_manager.aws_schema["properties"]["aws"]["required"] = []
+
+    def test_load_config_returns_independent_copies(self, config_manager):
+        """Test that mutating a loaded config does not leak into later loads"""
+        first = config_manager.load_config("aws")
+        first["aws"]["aws"]["region"] = "mutated"
+
+        second = config_manager.load_config("aws")
+        assert second["aws"]["aws"]["region"] == "us-east-1"
+
+    def test_load_config_sees_file_changes(self, config_manager):
+        """Test that the parse cache is invalidated when a file changes"""
+        config = config_manager.load_config()
+        config["aws"]["aws"]["region"] = "us-west-2"
+        config_manager.save_config(config)
+
+        assert config_manager.load_config("aws")["aws"]["aws"]["region"] == "us-west-2"
+
     def test_load_config_missing_file(self, temp_config_dir):
         """Test loading configuration with missing files"""
         config_manager = ConfigManager(temp_config_dir)
@@ -194,7 +219,66 @@ class TestConfigManager:
         errors = config_manager.validate_config(config, "sync")
         assert len(errors) > 0
         assert "Sync config validation error" in errors[0]
-    
+
+    def test_validate_config_reports_every_error(self, config_manager):
+        """Test that all schema violations are reported, not just the first"""
+        config = config_manager.load_config()
+
+        config["sync"]["sync_settings"]["mode"] = "invalid-mode"
+        config["sync"]["file_handling"]["concurrent_uploads"] = 0
+
+        errors = config_manager.validate_config(config, "sync")
+        assert len(errors) == 2
+
+    def test_is_config_valid(self, config_manager):
+        """Test the boolean validity check"""
+        config = config_manager.load_config()
+        assert config_manager.is_config_valid(config)
+
+        config["aws"]["aws"]["region"] = "invalid-region-!"
+        assert not config_manager.is_config_valid(config, "aws")
+        assert config_manager.is_config_valid(config, "sync")
+
+    @pytest.mark.parametrize("mutate", [
+        lambda c: None,
+        lambda c: c["aws"]["s3"].update(storage_class="COLD"),
+        lambda c: c["aws"]["sync"].update(max_concurrent_uploads=True),
+        lambda c: c["aws"]["sync"].update(chunk_size_mb=1.5),
+        lambda c: c["sync"]["filters"].pop("exclude_files"),
+        lambda c: c["sync"]["file_handling"].update(chunk_size=10),
+    ])
+    def test_is_config_valid_agrees_with_validate_config(self, config_manager, mutate):
+        """Test that the boolean fast path matches full error collection"""
+        config = config_manager.load_config()
+        mutate(config)
+
+        assert config_manager.is_config_valid(config) == (config_manager.validate_config(config) == [])
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_validate_config_file_matches_validate_config(self, config_manager, streaming):
+        """Test that validating files on disk agrees with validate_config"""
+        config = config_manager.load_config()
+        config["sync"]["sync_settings"]["mode"] = "invalid-mode"
+        del config["sync"]["filters"]
+        config_manager.save_config(config)
+
+        if not streaming:
+            with patch('config.config_manager.ijson', None):
+                errors = config_manager.validate_config_file()
+        else:
+            pytest.importorskip("ijson")
+            errors = config_manager.validate_config_file()
+
+        assert sorted(errors) == sorted(config_manager.validate_config(config))
+        assert len(errors) == 2
+
+    def test_validate_config_file_invalid_json(self, config_manager):
+        """Test that malformed files raise ConfigError"""
+        config_manager.sync_config_path.write_text("{ invalid json")
+
+        with pytest.raises(ConfigError, match="Failed to load sync config"):
+            config_manager.validate_config_file("sync")
+
     def test_create_environment_config_dev(self, config_manager):
         """Test creating development environment configuration"""
         base_config = config_manager.load_config()
@@ -267,7 +351,51 @@ class TestConfigManager:
         # Check that backup was created
         final_backup_count = len(list(config_manager.backup_dir.glob("*.json")))
         assert final_backup_count > initial_backup_count
-    
+
+    def test_save_config_unchanged_skips_write_and_backup(self, config_manager):
+        """Test that saving identical content leaves files and backups alone"""
+        config = config_manager.load_config()
+        config_manager.save_config(config)
+        backups_before = sorted(config_manager.backup_dir.glob("*.json"))
+        inode_before = config_manager.aws_config_path.stat().st_ino
+
+        config_manager.save_config(config)
+
+        assert sorted(config_manager.backup_dir.glob("*.json")) == backups_before
+        assert config_manager.aws_config_path.stat().st_ino == inode_before
+
+    def test_backup_preserves_content_after_save(self, config_manager):
+        """Test that a backup keeps the pre-save content"""
+        original = config_manager.aws_config_path.read_bytes()
+        config = config_manager.load_config()
+        config["aws"]["aws"]["region"] = "us-west-2"
+
+        config_manager.save_config(config)
+
+        backups = list(config_manager.backup_dir.glob("aws-config_*.json"))
+        assert len(backups) == 1
+        assert backups[0].read_bytes() == original
+
+    def test_backup_skipped_when_unchanged(self, config_manager):
+        """Test that repeated backups of an unchanged file are not duplicated"""
+        config_manager._create_backup()
+        config_manager._create_backup()
+
+        backups = list(config_manager.backup_dir.glob("aws-config_*.json"))
+        assert len(backups) == 1
+
+    def test_backup_survives_in_place_rewrite(self, config_manager):
+        """Test that a backup keeps its content when the live file is rewritten in place"""
+        original = config_manager.aws_config_path.read_bytes()
+        config_manager._create_backup()
+
+        with open(config_manager.aws_config_path, 'w') as f:
+            f.write('{"rewritten": true}')
+
+        backups = list(config_manager.backup_dir.glob("aws-config_*.json"))
+        assert len(backups) == 1
+        assert backups[0].read_bytes() == original
+
     def test_get_config_info(self, config_manager):
         """Test getting configuration information"""
         info = config_manager.get_config_info()
@@ -341,7 +469,21 @@ class TestConfigManager:
         errors = config_manager.validate_aws_credentials()
         assert len(errors) > 0
         assert "S3 bucket access error" in errors[0]
-    
+
+    @patch('boto3.Session')
+    def test_validate_aws_credentials_reuses_clients(self, mock_session, config_manager):
+        """Test that repeated validation reuses the session, clients and identity check"""
+        mock_sts = MagicMock()
+        mock_s3 = MagicMock()
+        mock_session.return_value.client.side_effect = [mock_sts, mock_s3]
+
+        assert config_manager.validate_aws_credentials() == []
+        assert config_manager.validate_aws_credentials() == []
+
+        assert mock_session.call_count == 1
+        assert mock_sts.get_caller_identity.call_count == 1
+        assert mock_s3.head_bucket.call_count == 2
+
     def test_deep_copy_config(self, config_manager):
         """Test deep copy of configuration"""
         original_config = config_manager.load_config()
@@ -58,4 +58,10 @@ def test_cloudwatch_logging(tmp_path):
         logger.log_file_upload(Path("/tmp/file.txt"), "file.txt", 100, True)
         assert mock_cw.called
         logger.log_sync_complete({'files_uploaded': 1, 'files_skipped': 0, 'files_failed': 0, 'bytes_uploaded': 100, 'retries_attempted': 0})
-        assert mock_cw.called
\ No newline at end of file
+        assert mock_cw.called
+
+def test_log_files_rotate_by_size(tmp_path):
+    logger = SyncLogger("test-operation", config={})
+    handlers = logger.rotation_handlers()
+    assert {Path(h.baseFilename).name for h in handlers} == {"test-operation.log", "test-operation-errors.log"}
+    assert all(isinstance(h, logging.handlers.RotatingFileHandler) and h.maxBytes > 0 for h in handlers)
@@ -1,6 +1,8 @@
 import math
 
-from core.smoothing import exponential_moving_average
+import pytest
+
+from core.smoothing import exponential_moving_average, exponential_moving_average_series
 
 
 def test_ema_seeds_with_sample_when_no_previous():
@@ -39,3 +41,18 @@ def test_ema_multiple_steps_monotonic_increase_when_sample_constant():
     assert all(results[i] < results[i+1] for i in range(len(results)-1))
 
 
+def test_ema_series_matches_scalar_updates():
+    samples = [3.0, 7.0, 7.0, 1.0, 4.0]
+    deltas = [1.0, 0.5, 0.0, 2.0, 1.5]
+    expected = []
+    value = 2.0
+    for sample, dt in zip(samples, deltas):
+        value = exponential_moving_average(value, sample, dt, 5.0)
+        expected.append(value)
+    result = exponential_moving_average_series(2.0, samples, deltas, 5.0)
+    assert result == [pytest.approx(x) for x in expected]
+
+
+def test_ema_series_seeds_from_first_sample_without_previous():
+    result = exponential_moving_average_series(None, [10.0, 10.0], [1.0, 1.0], 5.0)
+    assert result == [10.0, 10.0]
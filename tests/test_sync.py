@@ -20,6 +20,7 @@ import json
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import hashlib
+import mmap
 import time
 import random
 from botocore.exceptions import ClientError
@@ -374,6 +375,45 @@ class TestS3Sync:
         result = sync._upload_file_multipart(test_file, "large.txt")
         assert result is True
     
+    @pytest.mark.parametrize("age, mapped", [(0, False), (60, True)])
+    def test_upload_file_multipart_parts_replay_from_file(self, temp_dir, mock_s3_client, age, mapped):
+        """Test multipart parts are sent from the file and re-sent intact on retry
+
+        Only files left unmodified for a while are mapped; a recently
+        modified file may be truncated under the mapping (SIGBUS).
+        """
+        test_file = Path(temp_dir) / "large.bin"
+        content = os.urandom(1024 * 1024) * 2 + b"tail"
+        test_file.write_bytes(content)
+        mtime = time.time() - age
+        os.utime(test_file, (mtime, mtime))
+
+        sent = {}
+        def upload_part(**kwargs):
+            data = kwargs["Body"].read()
+            if kwargs["PartNumber"] == 2 and 2 not in sent:
+                sent[2] = b""
+                raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPart")
+            sent[kwargs["PartNumber"]] = data
+            return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+        mock_s3_client.create_multipart_upload.return_value = {"UploadId": "test-upload-id"}
+        mock_s3_client.upload_part.side_effect = upload_part
+
+        sync = S3Sync()
+        sync.s3_client = mock_s3_client
+        sync.bucket_name = "test-bucket"
+        sync.retry_delay_base = 0
+        sync.retry_delay_max = 0
+        sync.config = {"sync": {"chunk_size_mb": 1}}
+
+        with patch("core.sync_engine.mmap.mmap", wraps=mmap.mmap) as mapping:
+            assert sync._upload_file_multipart(test_file, "large.bin") is True
+        assert mapping.called is mapped
+        assert b"".join(sent[n] for n in sorted(sent)) == content
+        parts = mock_s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [p["PartNumber"] for p in parts] == [1, 2, 3]
+
     def test_upload_file_multipart_failure(self, temp_dir, mock_s3_client):
         """Test multipart file upload failure"""
         test_file = Path(temp_dir) / "large.txt"
@@ -0,0 +1,518 @@
+import hashlib
+import mmap
+import os
+import threading
+import time
+from pathlib import Path, PurePosixPath
+from unittest.mock import MagicMock, patch
+
+import pytest
+from boto3.exceptions import S3UploadFailedError
+from botocore.exceptions import ClientError
+
+from core.sync_engine import EngineConfig, SyncEngine, _compile_globs
+
+
+@pytest.fixture
+def s3_client():
+    with patch("core.sync_engine.boto3.Session") as mock_session:
+        client = MagicMock()
+        client.list_buckets.return_value = {}
+        mock_session.return_value.client.return_value = client
+        yield client
+
+
+@pytest.fixture
+def engine(tmp_path, s3_client):
+    config = EngineConfig(profile="test", bucket_name="test-bucket", local_path=tmp_path)
+    return SyncEngine(config)
+
+
+@pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+def test_calculate_file_hash_matches_hashlib(engine, tmp_path, algorithm):
+    data = b"0123456789abcdef" * 100_000
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    expected = hashlib.new(algorithm, data).hexdigest()
+    assert engine._calculate_file_hash(path, algorithm) == expected
+
+
+@pytest.mark.parametrize("buffer_bytes", [7, 1 << 20])
+def test_calculate_file_hash_fallback_without_file_digest(engine, tmp_path, monkeypatch, buffer_bytes):
+    data = b"x" * ((1 << 20) + 17)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    engine.config.hash_buffer_bytes = buffer_bytes
+    assert engine._calculate_file_hash(path, "md5") == hashlib.md5(data).hexdigest()
+
+
+def test_calculate_file_hash_rejects_unknown_algorithm(engine, tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"x")
+    with pytest.raises(ValueError):
+        engine._calculate_file_hash(path, "crc32")
+
+
+def test_calculate_file_hash_blake3(engine, tmp_path):
+    blake3 = pytest.importorskip("blake3")
+    data = b"blake3" * 10_000
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    assert engine._calculate_file_hash(path, "blake3") == blake3.blake3(data).hexdigest()
+
+
+def test_upload_stores_content_hash_metadata(engine, s3_client, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    assert engine._upload_file_simple(path, "a.txt")
+    extra = s3_client.upload_file.call_args.kwargs["ExtraArgs"]
+    assert extra["Metadata"]["content-sha256"] == hashlib.sha256(b"hello").hexdigest()
+
+
+@pytest.mark.parametrize("stored_data, expected", [(b"hello", False), (b"jello", True)])
+def test_should_upload_multipart_object_compares_stored_hash(engine, s3_client, tmp_path, stored_data, expected):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    s3_client.head_object.return_value = {
+        "ETag": '"abc-2"',
+        "ContentLength": 5,
+        "LastModified": None,
+        "Metadata": {"content-sha256": hashlib.sha256(stored_data).hexdigest()},
+    }
+    assert engine._should_upload_file(path, "a.txt") is expected
+
+
+def test_should_upload_uses_stored_hash_without_md5(engine, s3_client, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    s3_client.head_object.return_value = {
+        "ETag": '"not-the-md5"',
+        "ContentLength": 5,
+        "LastModified": None,
+        "Metadata": {"content-sha256": hashlib.sha256(b"hello").hexdigest()},
+    }
+    with patch.object(engine, "_calculate_file_hash", wraps=engine._calculate_file_hash) as calc:
+        assert engine._should_upload_file(path, "a.txt") is False
+        assert engine._should_upload_file(path, "a.txt") is False
+    calc.assert_called_once_with(path, "sha256")
+
+
+def test_hash_cache_persists_and_invalidates(tmp_path, s3_client):
+    cache_path = tmp_path / "cache" / "hashes.json"
+    config = EngineConfig(profile="test", bucket_name="b", local_path=tmp_path, hash_cache_path=cache_path)
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+
+    first = SyncEngine(config)
+    digest = first._cached_file_hash(path, "sha256")
+    first._save_hash_cache()
+    assert cache_path.exists()
+
+    second = SyncEngine(config)
+    with patch.object(second, "_calculate_file_hash") as calc:
+        assert second._cached_file_hash(path, "sha256") == digest
+    calc.assert_not_called()
+
+    path.write_bytes(b"hello, world")
+    assert second._cached_file_hash(path, "sha256") == hashlib.sha256(b"hello, world").hexdigest()
+
+
+
+def test_upload_uses_transfer_config_for_multipart(tmp_path, s3_client):
+    config = EngineConfig(
+        profile="test", bucket_name="b", local_path=tmp_path, chunk_size_mb=8, max_concurrent_parts=4
+    )
+    engine = SyncEngine(config)
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    assert engine._upload_file_simple(path, "a.txt")
+    transfer = s3_client.upload_file.call_args.kwargs["Config"]
+    assert transfer.multipart_threshold == 100 * 1024 * 1024
+    assert transfer.multipart_chunksize == 8 * 1024 * 1024
+    assert transfer.max_concurrency == 4
+
+
+def _listing(s3_client, objects):
+    pages = [{"Contents": [{"Key": k, "Size": size, "ETag": f'"{etag}"'} for k, size, etag in objects]}]
+    s3_client.get_paginator.return_value.paginate.return_value = pages
+
+
+def test_check_files_uses_bucket_listing(engine, s3_client, tmp_path):
+    for name, data in {"same.txt": b"hello", "changed.txt": b"hello", "resized.txt": b"hi", "new.txt": b"x"}.items():
+        (tmp_path / name).write_bytes(data)
+    _listing(
+        s3_client,
+        [
+            ("same.txt", 5, hashlib.md5(b"hello").hexdigest()),
+            ("changed.txt", 5, hashlib.md5(b"jello").hexdigest()),
+            ("resized.txt", 5, hashlib.md5(b"hello").hexdigest()),
+        ],
+    )
+    progress = []
+    result = engine.check_files_to_sync(engine.discover_all_files(), on_progress=lambda d, t: progress.append((d, t)))
+    assert sorted(f.s3_key for f in result) == ["changed.txt", "new.txt", "resized.txt"]
+    s3_client.head_object.assert_not_called()
+    assert progress[-1] == (4, 4)
+
+
+def test_check_files_heads_multipart_objects_only(engine, s3_client, tmp_path):
+    (tmp_path / "big.bin").write_bytes(b"hello")
+    _listing(s3_client, [("big.bin", 5, "abc-2")])
+    s3_client.head_object.return_value = {
+        "ETag": '"abc-2"',
+        "ContentLength": 5,
+        "LastModified": None,
+        "Metadata": {"content-sha256": hashlib.sha256(b"hello").hexdigest()},
+    }
+    assert engine.check_files_to_sync(engine.discover_all_files()) == []
+    s3_client.head_object.assert_called_once_with(Bucket="test-bucket", Key="big.bin")
+
+
+def test_check_files_falls_back_to_head_when_listing_denied(engine, s3_client, tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"hello")
+    engine.config.max_retries = 0
+    s3_client.get_paginator.return_value.paginate.side_effect = ClientError(
+        {"Error": {"Code": "AccessDenied"}}, "ListObjectsV2"
+    )
+    s3_client.head_object.return_value = {"ETag": '"x"', "ContentLength": 99, "LastModified": None}
+    assert [f.s3_key for f in engine.check_files_to_sync(engine.discover_all_files())] == ["a.txt"]
+    s3_client.head_object.assert_called_once()
+
+
+def test_upload_progress_counts_each_file_once(engine, s3_client, tmp_path):
+    engine.config.verify_upload = False
+    for i in range(50):
+        (tmp_path / f"f{i}.txt").write_bytes(b"x")
+    progress = []
+    engine.upload_files(engine.discover_all_files(), on_progress=lambda d, t: progress.append((d, t)))
+    assert sorted(progress) == [(i, 50) for i in range(1, 51)]
+
+
+def test_upload_worker_stats_file_once(engine, s3_client, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    s3_client.head_object.return_value = {"ETag": '"x"', "ContentLength": 5, "LastModified": None}
+    done = []
+    files = engine.discover_all_files()
+    with patch.object(Path, "stat", autospec=True, side_effect=Path.stat) as stat:
+        engine.upload_files(files, on_file_done=lambda item, ok, size: done.append((ok, size)))
+    assert done == [(True, 5)]
+    assert engine.stats.bytes_uploaded == 5
+    assert [c.args[0] for c in stat.call_args_list].count(path) == 1
+
+
+def test_discover_all_files_walks_nested_directories(engine, tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.txt").write_bytes(b"1")
+    (tmp_path / "a" / "mid.txt").write_bytes(b"2")
+    (tmp_path / "a" / "b" / "deep.txt").write_bytes(b"3")
+    (tmp_path / "empty").mkdir()
+    files = engine.discover_all_files()
+    assert sorted(f.s3_key for f in files) == ["a/b/deep.txt", "a/mid.txt", "top.txt"]
+    assert all(f.local_path.is_file() for f in files)
+
+
+def test_discover_batch_and_check_without_stat(engine, s3_client, tmp_path):
+    (tmp_path / "same.txt").write_bytes(b"hello")
+    (tmp_path / "new.txt").write_bytes(b"hi")
+    batch = engine.discover_batch()
+    assert len(batch) == 2
+    assert dict(zip(batch.s3_keys, batch.sizes)) == {"same.txt": 5, "new.txt": 2}
+
+    _listing(s3_client, [("same.txt", 5, hashlib.md5(b"hello").hexdigest())])
+    with patch.object(Path, "stat", side_effect=AssertionError("stat during listing comparison")):
+        result = engine.check_files_to_sync(batch)
+    assert [(f.local_path, f.s3_key) for f in result] == [(tmp_path / "new.txt", "new.txt")]
+
+
+@pytest.mark.parametrize(
+    "pattern", ["*.txt", "b/*.txt", "/a/*/c.txt", "._*", ".DS_Store", "[!a]*.log", "[]x]y", "?.t*", "*/*", "x["]
+)
+def test_compiled_globs_agree_with_path_match(pattern):
+    regex = _compile_globs((pattern,))
+    for path in ["/a/b/c.txt", "/a/._x", "/q/.DS_Store", "/a/b.log", "/a/c.log", "/]y", "/p/1.tx", "/x[", "/d/b.txt/c"]:
+        assert bool(regex.search(path)) == PurePosixPath(path).match(pattern), path
+
+
+def test_include_and_exclude_patterns(tmp_path, s3_client):
+    config = EngineConfig(
+        profile="test",
+        bucket_name="b",
+        local_path=tmp_path,
+        include_patterns=["*.txt", "*.log"],
+        exclude_patterns=["skip*"],
+    )
+    engine = SyncEngine(config)
+    for name in ["keep.txt", "keep.log", "skip.txt", "other.bin"]:
+        (tmp_path / name).write_bytes(b"x")
+    assert sorted(f.s3_key for f in engine.discover_all_files()) == ["keep.log", "keep.txt"]
+
+
+def test_upload_stats_totals_across_threads(engine, s3_client, tmp_path):
+    engine.config.verify_upload = False
+    engine.config.max_retries = 0
+    for i in range(40):
+        (tmp_path / f"f{i:02d}.txt").write_bytes(b"x" * (i + 1))
+
+    def upload_file(filename, *args, **kwargs):
+        if filename.endswith("7.txt"):
+            raise ClientError({"Error": {"Code": "500"}}, "PutObject")
+
+    s3_client.upload_file.side_effect = upload_file
+    engine.upload_files(engine.discover_all_files())
+    failed = [i for i in range(40) if i % 10 == 7]
+    assert engine.stats.files_failed == len(failed)
+    assert engine.stats.files_uploaded == 40 - len(failed)
+    assert engine.stats.bytes_uploaded == sum(i + 1 for i in range(40) if i not in failed)
+
+
+@pytest.mark.parametrize("algorithm", ["md5", "sha256"])
+def test_calculate_file_hash_mmap_slices(engine, tmp_path, monkeypatch, algorithm):
+    monkeypatch.setattr("core.sync_engine.HASH_MMAP_MIN_BYTES", 1)
+    monkeypatch.setattr("core.sync_engine.HASH_MMAP_SLICE_BYTES", 4096)
+    monkeypatch.setattr("core.sync_engine.HASH_MMAP_SETTLE_SECONDS", 0)
+    data = bytes(range(256)) * 1000 + b"tail"
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    with patch.object(engine, "_hash_mapped", wraps=engine._hash_mapped) as mapped:
+        assert engine._calculate_file_hash(path, algorithm) == hashlib.new(algorithm, data).hexdigest()
+    mapped.assert_called_once()
+
+
+@pytest.mark.parametrize("age, mapped", [(0, False), (60, True)])
+def test_only_settled_files_are_mapped(engine, tmp_path, monkeypatch, age, mapped):
+    # A file still being written may be truncated under the mapping (SIGBUS)
+    monkeypatch.setattr("core.sync_engine.HASH_MMAP_MIN_BYTES", 1)
+    data = os.urandom(10_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    with patch("core.sync_engine.mmap.mmap", wraps=mmap.mmap) as mapping:
+        assert engine._calculate_file_hash(path, "md5") == hashlib.md5(data).hexdigest()
+        assert engine._calculate_multipart_etag(path, 3000) == _multipart_etag(data, 3000)
+    assert mapping.called is mapped
+
+
+def test_check_files_pipelines_head_and_hash_stages(engine, s3_client, tmp_path):
+    engine.config.max_concurrent_hashes = 2
+    files = {"plain-same": b"a", "plain-diff": b"b", "multi-same": b"c", "multi-diff": b"d", "multi-nohash": b"e"}
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+    _listing(
+        s3_client,
+        [
+            ("plain-same", 1, hashlib.md5(b"a").hexdigest()),
+            ("plain-diff", 1, hashlib.md5(b"z").hexdigest()),
+            ("multi-same", 1, "x-2"),
+            ("multi-diff", 1, "x-2"),
+            ("multi-nohash", 1, "x-2"),
+        ],
+    )
+    stored = {"multi-same": b"c", "multi-diff": b"z"}
+
+    def head_object(Bucket, Key):
+        metadata = {"content-sha256": hashlib.sha256(stored[Key]).hexdigest()} if Key in stored else {}
+        return {"ETag": '"x-2"', "ContentLength": 1, "LastModified": None, "Metadata": metadata}
+
+    s3_client.head_object.side_effect = head_object
+    progress = []
+    result = engine.check_files_to_sync(engine.discover_all_files(), on_progress=lambda d, t: progress.append(d))
+    assert sorted(f.s3_key for f in result) == ["multi-diff", "plain-diff"]
+    assert s3_client.head_object.call_count == 3
+    assert max(progress) == 5
+
+
+def test_client_pool_sized_for_concurrency(tmp_path):
+    with patch("core.sync_engine.boto3.Session") as mock_session:
+        config = EngineConfig(profile="test", bucket_name="b", local_path=tmp_path, max_concurrent_uploads=32)
+        SyncEngine(config)
+    cfg = mock_session.return_value.client.call_args.kwargs["config"]
+    assert cfg.max_pool_connections == 64
+    assert cfg.tcp_keepalive is True
+
+
+def _client_error(code, status=None):
+    response = {"Error": {"Code": code}}
+    if status:
+        response["ResponseMetadata"] = {"HTTPStatusCode": status}
+    return ClientError(response, "PutObject")
+
+
+@pytest.mark.parametrize(
+    "error, attempts",
+    [
+        (_client_error("SlowDown", 503), 3),
+        (_client_error("InternalError", 500), 3),
+        (_client_error("500"), 3),
+        (_client_error("AccessDenied", 403), 1),
+        (_client_error("404"), 1),
+    ],
+)
+def test_retry_only_transient_errors(engine, error, attempts):
+    engine.config.max_retries = 2
+    func = MagicMock(side_effect=error)
+    with patch("core.sync_engine.time.sleep") as sleep, pytest.raises(ClientError):
+        engine._retry_with_backoff(func)
+    assert func.call_count == attempts
+    assert sleep.call_count == attempts - 1
+
+
+def test_retry_unwraps_upload_failures(engine):
+    def fail(cause):
+        try:
+            raise cause
+        except ClientError:
+            raise S3UploadFailedError("upload failed")
+
+    engine.config.max_retries = 3
+    func = MagicMock(side_effect=lambda: fail(_client_error("SlowDown", 503)))
+    with patch("core.sync_engine.time.sleep"), pytest.raises(S3UploadFailedError):
+        engine._retry_with_backoff(func)
+    assert func.call_count == 4
+
+    func = MagicMock(side_effect=lambda: fail(_client_error("AccessDenied", 403)))
+    with patch("core.sync_engine.time.sleep"), pytest.raises(S3UploadFailedError):
+        engine._retry_with_backoff(func)
+    assert func.call_count == 1
+
+
+def test_retry_delays_use_decorrelated_jitter(engine):
+    engine.config.max_retries = 20
+    engine.config.retry_delay_base = 1.0
+    engine.config.retry_delay_max = 10.0
+    func = MagicMock(side_effect=[_client_error("SlowDown", 503)] * 20 + ["ok"])
+    with patch("core.sync_engine.time.sleep") as sleep:
+        assert engine._retry_with_backoff(func) == "ok"
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert len(delays) == 20
+    assert all(1.0 <= d <= 10.0 for d in delays)
+    assert all(d <= max(prev * 3, 1.0) for prev, d in zip([1.0] + delays, delays))
+
+
+def test_head_object_retries_transient_errors(engine, s3_client):
+    engine.config.max_retries = 2
+    s3_client.head_object.side_effect = [
+        _client_error("SlowDown", 503),
+        {"ETag": '"x"', "ContentLength": 1, "LastModified": None},
+    ]
+    with patch("core.sync_engine.time.sleep"):
+        assert engine._get_s3_object_metadata("a.txt")["size"] == 1
+    assert s3_client.head_object.call_count == 2
+
+
+def test_only_the_transfer_client_keeps_botocore_retries(engine):
+    retries = [c.kwargs["config"].retries for c in engine._session.client.call_args_list]
+    assert retries == [
+        {"total_max_attempts": 1, "mode": "standard"},
+        {"total_max_attempts": engine.config.max_retries + 1, "mode": "standard"},
+    ]
+
+
+def test_discovery_filters_in_bulk(tmp_path, s3_client):
+    config = EngineConfig(profile="test", bucket_name="b", local_path=tmp_path, exclude_patterns=["*.tmp", "cache/*"])
+    engine = SyncEngine(config)
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "sub" / "cache").mkdir(parents=True)
+    for name in ["a.txt", "a.tmp", "cache/x.bin", "sub/cache/y.bin", "sub/b.txt"]:
+        (tmp_path / name).write_bytes(b"x")
+    with patch.object(engine, "_should_include_file", side_effect=AssertionError("per-file match")):
+        keys = sorted(f.s3_key for f in engine.discover_all_files())
+    assert keys == ["a.txt", "sub/b.txt"]
+
+
+def test_walk_keys_match_calculate_s3_key(engine, tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c.txt").write_bytes(b"x")
+    (tmp_path / "top.txt").write_bytes(b"x")
+    for item in engine.discover_all_files():
+        assert item.s3_key == engine._calculate_s3_key(item.local_path)
+    assert engine._walk_key("/elsewhere/x/y/z.txt") == "x/y/z.txt"
+
+
+def _multipart_etag(data, part_size):
+    digests = b"".join(hashlib.md5(data[i:i + part_size]).digest() for i in range(0, len(data), part_size))
+    return f"{hashlib.md5(digests).hexdigest()}-{-(-len(data) // part_size)}"
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_calculate_multipart_etag(engine, tmp_path, monkeypatch, mapped):
+    monkeypatch.setattr("core.sync_engine.HASH_MMAP_SETTLE_SECONDS", 0)
+    if not mapped:
+        monkeypatch.setattr("core.sync_engine.mmap.mmap", MagicMock(side_effect=OSError))
+    engine.config.hash_buffer_bytes = 1000
+    data = os.urandom(10_000)
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    for part_size in (1000, 3000, 10_000):
+        assert engine._calculate_multipart_etag(path, part_size) == _multipart_etag(data, part_size)
+
+
+@pytest.mark.parametrize("uploaded, expected", [(b"same", True), (b"diff", False)])
+def test_verify_upload_compares_multipart_etag(engine, s3_client, tmp_path, uploaded, expected):
+    engine.config.hash_algorithm = "md5"
+    engine.config.chunk_size_mb = 1
+    data = os.urandom(2 * 1024 * 1024) + b"same"
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+    etag = _multipart_etag(data[:-4] + uploaded, 1024 * 1024)
+    s3_client.head_object.return_value = {"ETag": f'"{etag}"', "ContentLength": len(data), "LastModified": None}
+    assert engine._verify_upload(path, "data.bin") is expected
+
+
+@pytest.mark.parametrize(
+    "stored_data, metadata, expected",
+    [
+        (b"same", {"chunk-size": str(1024 * 1024)}, False),
+        (b"diff", {"chunk-size": str(1024 * 1024)}, True),
+        (b"same", {}, False),
+        (b"diff", {}, True),
+    ],
+)
+def test_should_upload_recomputes_multipart_etag(engine, s3_client, tmp_path, stored_data, metadata, expected):
+    engine.config.hash_algorithm = "md5"
+    engine.config.chunk_size_mb = 1
+    data = os.urandom(2 * 1024 * 1024 + 5)
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+    remote = data if stored_data == b"same" else data[:-1] + b"?"
+    s3_client.head_object.return_value = {
+        "ETag": f'"{_multipart_etag(remote, 1024 * 1024)}"',
+        "ContentLength": len(data),
+        "LastModified": None,
+        "Metadata": metadata,
+    }
+    assert engine._should_upload_file(path, "big.bin") is expected
+
+
+def test_should_upload_skips_unreconstructable_multipart_etag(engine, s3_client, tmp_path):
+    engine.config.hash_algorithm = "md5"
+    path = tmp_path / "a.bin"
+    path.write_bytes(b"x" * 100)
+    s3_client.head_object.return_value = {"ETag": '"abc-7"', "ContentLength": 100, "LastModified": None}
+    assert engine._should_upload_file(path, "a.bin") is False
+
+
+def test_upload_metadata_records_chunk_size(engine, s3_client, tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"hello")
+    engine._upload_file_simple(path, "a.txt")
+    extra = s3_client.upload_file.call_args.kwargs["ExtraArgs"]
+    assert extra["Metadata"]["chunk-size"] == str(100 * 1024 * 1024)
+
+
+def test_pools_persist_across_runs_until_close(engine, s3_client, tmp_path):
+    engine.config.verify_upload = False
+    (tmp_path / "a.txt").write_bytes(b"x")
+    threads = set()
+    s3_client.upload_file.side_effect = lambda *a, **k: threads.add(threading.current_thread())
+    for _ in range(3):
+        engine.upload_files(engine.discover_all_files())
+    assert len(threads) == 1
+    assert next(iter(threads)).name.startswith("sync-upload")
+
+    with engine:
+        pass
+    with pytest.raises(RuntimeError):
+        engine.upload_files(engine.discover_all_files())
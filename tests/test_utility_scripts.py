@@ -14,13 +14,17 @@ AWS Concepts Covered:
 - Error handling and edge cases
 """
 
+import concurrent.futures
+import io
 import json
 import pytest
+import tarfile
 import tempfile
+import time
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 # Import the modules to test
 import sys
@@ -177,6 +181,263 @@ class TestBackupManager:
         assert results["success"] == True
         assert results["backup_path"] is not None
     
+    @pytest.mark.parametrize("use_binaries", [True, False])
+    def test_tar_archive_round_trip(self, backup_manager, tmp_path, use_binaries):
+        """Test archive creation and extraction with and without tar/gzip binaries"""
+        source = tmp_path / "backup_src"
+        (source / "nested").mkdir(parents=True)
+        (source / "a.txt").write_text("alpha")
+        (source / "nested" / "b.bin").write_bytes(os.urandom(4096))
+        archive = tmp_path / "backup_src.tar.gz"
+        
+        which = shutil.which if use_binaries else (lambda name: None)
+        with patch("scripts.backup.shutil.which", side_effect=which):
+            backup_manager._write_archive(archive, {"backup_type": "test"}, source, ["a.txt", "nested"])
+            out = tmp_path / "out"
+            out.mkdir()
+            backup_manager._extract_tar_archive(archive, out)
+        
+        assert json.loads((out / "manifest.json").read_text()) == {"backup_type": "test"}
+        assert (out / "a.txt").read_text() == "alpha"
+        assert (out / "nested" / "b.bin").read_bytes() == (source / "nested" / "b.bin").read_bytes()
+    
+    def test_extract_rejects_members_outside_destination(self, backup_manager, tmp_path):
+        """Test the tarfile fallback refuses members escaping the extract directory"""
+        if not hasattr(tarfile, "data_filter"):
+            pytest.skip("tarfile extraction filters are not available")
+        archive = tmp_path / "evil.tar.gz"
+        with tarfile.open(archive, "w:gz") as tar:
+            info = tarfile.TarInfo("../escaped.txt")
+            info.size = 4
+            tar.addfile(info, io.BytesIO(b"evil"))
+        out = tmp_path / "out"
+        out.mkdir()
+        
+        with patch("scripts.backup.shutil.which", return_value=None), pytest.raises(tarfile.FilterError):
+            backup_manager._extract_tar_archive(archive, out)
+        assert not (tmp_path / "escaped.txt").exists()
+    
+    def test_config_backup_round_trip(self, backup_manager):
+        """Test a config backup archives config files in place and restores them"""
+        config_file = backup_manager.project_root / "config" / "sync-config.json"
+        config_file.write_text('{"sync": {}}')
+        
+        results = backup_manager.create_config_backup()
+        assert results["success"], results["errors"]
+        assert not [p for p in backup_manager.backup_dir.iterdir() if p.is_dir()]
+        
+        config_file.write_text("{}")
+        restored = backup_manager.restore_backup(results["backup_path"])
+        assert restored["success"], restored["errors"]
+        assert config_file.read_text() == '{"sync": {}}'
+    
+    @pytest.mark.parametrize("use_binaries", [True, False])
+    def test_local_backup_round_trip(self, backup_manager, use_binaries):
+        """Test a local backup archives config, logs and data and restores them"""
+        root = backup_manager.project_root
+        (root / "config" / "aws-config.json").write_text('{"aws": {}}')
+        (root / "logs" / "sync.log").write_text("log line")
+        (root / "data" / "sub").mkdir()
+        (root / "data" / "sub" / "file.txt").write_text("payload")
+        
+        which = shutil.which if use_binaries else (lambda name: None)
+        with patch("scripts.backup.shutil.which", side_effect=which):
+            results = backup_manager.create_local_backup()
+            assert results["success"], results["errors"]
+            staged = [p for p in backup_manager.backup_dir.iterdir() if p.is_dir() and p != backup_manager.snapshot_dir]
+            assert not staged
+            
+            (root / "data" / "sub" / "file.txt").write_text("changed")
+            (root / "config" / "aws-config.json").write_text("{}")
+            restored = backup_manager.restore_backup(results["backup_path"])
+        
+        assert restored["success"], restored["errors"]
+        assert (root / "data" / "sub" / "file.txt").read_text() == "payload"
+        assert (root / "config" / "aws-config.json").read_text() == '{"aws": {}}'
+    
+    def test_incremental_local_backup_chain(self, backup_manager):
+        """Test incremental backups restore through their chain and survive cleanup"""
+        if not shutil.which("tar") or not shutil.which("gzip"):
+            pytest.skip("GNU tar and gzip are required for incremental backups")
+        data = backup_manager.project_root / "data"
+        (data / "sub").mkdir()
+        (data / "gone.txt").write_text("deleted later")
+        (data / "sub" / "kept.txt").write_text("v1")
+        
+        archives = []
+        for second in range(2):
+            with patch("scripts.backup.datetime") as mock_datetime:
+                mock_datetime.now.return_value = datetime(2026, 1, 1, 0, 0, second)
+                results = backup_manager.create_local_backup()
+            assert results["success"], results["errors"]
+            archives.append(Path(results["backup_path"]))
+            (data / "gone.txt").unlink(missing_ok=True)
+            (data / "sub" / "kept.txt").write_text("v2")
+            (data / "new.txt").write_text("added")
+        
+        levels = [backup_manager._read_sidecar(a)["incremental"]["level"] for a in archives]
+        assert levels == [0, 1]
+        
+        backup_manager.max_backups = 1
+        assert backup_manager.cleanup_old_backups()["deleted_count"] == 0
+        
+        (data / "new.txt").write_text("changed after backup")
+        restored = backup_manager.restore_backup(str(archives[1]))
+        assert restored["success"], restored["errors"]
+        assert not (data / "gone.txt").exists()
+        assert (data / "sub" / "kept.txt").read_text() == "v2"
+        assert (data / "new.txt").read_text() == "added"
+    
+    def test_local_backup_without_gnu_tar_is_full(self, backup_manager):
+        """Test a tar other than GNU tar (e.g. bsdtar) writes full, restorable archives"""
+        if not shutil.which("tar") or not shutil.which("gzip"):
+            pytest.skip("tar and gzip are required")
+        data = backup_manager.project_root / "data"
+        (data / "file.txt").write_text("payload")
+
+        with patch("scripts.backup._is_gnu_tar", return_value=False):
+            results = backup_manager.create_local_backup()
+            assert results["success"], results["errors"]
+            assert "incremental" not in backup_manager._read_sidecar(Path(results["backup_path"]))
+
+            (data / "file.txt").write_text("changed")
+            restored = backup_manager.restore_backup(results["backup_path"])
+
+        assert restored["success"], restored["errors"]
+        assert (data / "file.txt").read_text() == "payload"
+
+    @pytest.mark.parametrize("in_kernel", [True, False])
+    def test_fast_copy(self, backup_manager, tmp_path, in_kernel):
+        """Test file copies via copy_file_range and the userspace fallback"""
+        if not hasattr(os, "copy_file_range"):
+            pytest.skip("os.copy_file_range is not available")
+        source = tmp_path / "src.bin"
+        source.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+        dest_dir = tmp_path / "out"
+        dest_dir.mkdir()
+        
+        copy_file_range = os.copy_file_range if in_kernel else MagicMock(side_effect=OSError("EXDEV"))
+        with patch("scripts.backup.os.copy_file_range", copy_file_range, create=True):
+            backup_manager._fast_copy(source, dest_dir)
+        
+        copied = dest_dir / "src.bin"
+        assert copied.read_bytes() == source.read_bytes()
+        assert copied.stat().st_mtime == source.stat().st_mtime
+    
+    @pytest.mark.parametrize("can_link", [True, False])
+    def test_link_tree(self, backup_manager, tmp_path, can_link):
+        """Test data snapshots hardlink files and fall back to copying"""
+        source = tmp_path / "src"
+        (source / "sub").mkdir(parents=True)
+        (source / "sub" / "f.txt").write_text("payload")
+        dest = tmp_path / "dest"
+        
+        link = os.link if can_link else MagicMock(side_effect=OSError("EXDEV"))
+        with patch("scripts.backup.os.link", link):
+            backup_manager._link_tree(source, dest)
+        
+        assert (dest / "sub" / "f.txt").read_text() == "payload"
+        assert (dest / "sub" / "f.txt").stat().st_nlink == (2 if can_link else 1)
+    
+    @pytest.mark.parametrize("use_binaries", [True, False])
+    def test_create_s3_backup_streams_archive(self, backup_manager, tmp_path, use_binaries):
+        """Test S3 backups stream the archive through the shared client with multipart settings"""
+        (backup_manager.project_root / "data" / "file.txt").write_text("payload")
+        uploaded = {}
+        
+        def upload_fileobj(fileobj, bucket, key, **kwargs):
+            uploaded[key] = fileobj.read()
+        
+        which = shutil.which if use_binaries else (lambda name: None)
+        with patch("boto3.Session") as mock_session, \
+                patch("scripts.backup.shutil.which", side_effect=which):
+            s3 = mock_session.return_value.client.return_value
+            s3.upload_fileobj.side_effect = upload_fileobj
+            results = backup_manager.create_s3_backup("my-bucket")
+            assert results["success"], results["errors"]
+            backup_manager.create_s3_backup("my-bucket")
+        
+        mock_session.assert_called_once()
+        assert mock_session.return_value.client.call_args.kwargs["config"].max_pool_connections == 50
+        s3.upload_file.assert_not_called()
+        config = s3.upload_fileobj.call_args.kwargs["Config"]
+        assert config.multipart_chunksize == 16 * 1024 * 1024
+        assert config.use_threads
+        assert not list(backup_manager.backup_dir.glob("*.tar.gz"))
+        
+        key, body = next(iter(uploaded.items()))
+        assert key.endswith(".tar.zst" if use_binaries and shutil.which("zstd") else ".tar.gz")
+        archive = tmp_path / Path(key).name
+        archive.write_bytes(body)
+        with backup_manager._open_archive_reader(archive) as tar:
+            member = tar.next()
+            assert member.name == "manifest.json"
+            names = {m.name: tar.extractfile(m).read() for m in tar if m.isfile()}
+        assert names["data/file.txt"] == b"payload"
+    
+    def test_list_backups_reads_manifest_sidecar(self, backup_manager):
+        """Test backups list from the manifest sidecar and cleanup removes it"""
+        results = backup_manager.create_local_backup(include_data=False)
+        archive = Path(results["backup_path"])
+        sidecar = backup_manager._manifest_sidecar(archive)
+        assert json.loads(sidecar.read_text())["backup_type"] == "local"
+        
+        with patch("scripts.backup.tarfile.open") as tar_open:
+            backups = backup_manager.list_backups()
+        tar_open.assert_not_called()
+        assert backups[0]["type"] == "local"
+        
+        backup_manager.retention_days = -1
+        backup_manager.cleanup_old_backups()
+        assert not archive.exists()
+        assert not sidecar.exists()
+    
+    def test_read_manifest_stops_at_first_member(self, backup_manager):
+        """Test manifests are read from the archive head when there is no sidecar"""
+        (backup_manager.project_root / "data" / "big.bin").write_bytes(os.urandom(1 << 20))
+        with patch("scripts.backup.shutil.which", return_value=None):
+            results = backup_manager.create_local_backup()
+        archive = Path(results["backup_path"])
+        backup_manager._manifest_sidecar(archive).unlink()
+        
+        next_member = tarfile.TarFile.next
+        with patch.object(tarfile.TarFile, "next", autospec=True, side_effect=next_member) as member_reads:
+            assert backup_manager._read_manifest(archive)["backup_type"] == "local"
+        # Opening reads the first header; a full scan would read every member
+        assert member_reads.call_count <= 2
+    
+    def test_cleanup_old_backups_keeps_newest(self, backup_manager):
+        """Test cleanup trims to max_backups from file timestamps alone"""
+        for i in range(3):
+            (backup_manager.backup_dir / f"local_backup_{i}.tar.gz").write_bytes(b"not a tar")
+        backup_manager.max_backups = 1
+        
+        with patch("scripts.backup.tarfile.open") as tar_open:
+            results = backup_manager.cleanup_old_backups()
+        
+        tar_open.assert_not_called()
+        assert results["deleted_count"] == 2, results["errors"]
+        assert len(list(backup_manager.backup_dir.glob("*.tar.gz"))) == 1
+    
+    def test_cleanup_s3_backups_batches_deletes(self, backup_manager):
+        """Test expired S3 backups are deleted with batched DeleteObjects calls"""
+        old = datetime.now(timezone.utc) - timedelta(days=backup_manager.retention_days + 1)
+        new = datetime.now(timezone.utc)
+        contents = [{"Key": f"backups/old_{i}.tar.gz", "LastModified": old} for i in range(1500)]
+        contents.append({"Key": "backups/new.tar.gz", "LastModified": new})
+        
+        with patch("boto3.Session") as mock_session:
+            s3 = mock_session.return_value.client.return_value
+            s3.get_paginator.return_value.paginate.return_value = [{"Contents": contents}]
+            s3.delete_objects.return_value = {}
+            results = backup_manager.cleanup_old_backups("my-bucket")
+        
+        assert results["success"], results["errors"]
+        assert results["deleted_count"] == 1500
+        batches = [call.kwargs["Delete"]["Objects"] for call in s3.delete_objects.call_args_list]
+        assert sorted(len(b) for b in batches) == [500, 1000]
+        assert {"Key": "backups/new.tar.gz"} not in [k for b in batches for k in b]
+    
     def test_list_backups(self, backup_manager):
         """Test backup listing"""
         backups = backup_manager.list_backups()
@@ -251,6 +512,39 @@ class TestRestoreManager:
         result = restore_manager._s3_key_to_local_path("other/test.txt")
         assert result == "data/other/test.txt"
 
+    def test_restore_from_incremental_backup(self, restore_manager):
+        """Test an incremental local backup restores through its whole chain"""
+        if not shutil.which("tar") or not shutil.which("gzip"):
+            pytest.skip("GNU tar and gzip are required for incremental backups")
+        root = restore_manager.project_root
+        (root / "config" / "aws-config.json").write_text('{"aws": {}}')
+        data = root / "data"
+        (data / "gone.txt").write_text("deleted later")
+        (data / "kept.txt").write_text("v1")
+
+        backup_manager = BackupManager(root)
+        archives = []
+        for second in range(2):
+            with patch("scripts.backup.datetime") as mock_datetime:
+                mock_datetime.now.return_value = datetime(2026, 1, 1, 0, 0, second)
+                results = backup_manager.create_local_backup()
+            assert results["success"], results["errors"]
+            archives.append(results["backup_path"])
+            (data / "gone.txt").unlink(missing_ok=True)
+            (data / "new.txt").write_text("added")
+        assert backup_manager._read_sidecar(Path(archives[1]))["incremental"]["level"] == 1
+
+        shutil.rmtree(data)
+        (root / "config" / "aws-config.json").unlink()
+        restored = restore_manager.restore_from_backup(archives[1])
+
+        assert restored["success"], restored["errors"]
+        assert (root / "config" / "aws-config.json").read_text() == '{"aws": {}}'
+        assert (data / "kept.txt").read_text() == "v1"
+        assert (data / "new.txt").read_text() == "added"
+        assert not (data / "gone.txt").exists()
+        assert list(restore_manager.restore_dir.iterdir()) == []
+
 
 class TestCleanupManager:
     """Test suite for CleanupManager class"""
@@ -321,6 +615,156 @@ class TestCleanupManager:
         assert "deleted_count" in results
         assert "errors" in results
     
+    def test_cleanup_logs_expires_rotated_and_stale_logs(self, cleanup_manager):
+        """Test log cleanup expires rotated and stale logs but not files being written"""
+        logs_dir = cleanup_manager.project_root / "logs"
+        time_ago = (datetime.now() - timedelta(days=cleanup_manager.log_retention_days + 1)).timestamp()
+        expired = ["backup.log", "backup.log.2026-01-01", "sync-errors.log.3"]
+        for name in expired + ["cleanup.log", "notes.txt"]:
+            (logs_dir / name).write_text("log")
+            os.utime(logs_dir / name, (time_ago, time_ago))
+        (logs_dir / "recent.log.2026-01-02").write_text("log")
+        handler = MagicMock(baseFilename=str(logs_dir / "cleanup.log"))
+
+        with patch.object(cleanup_manager.logger, "rotation_handlers", return_value=[handler]):
+            assert cleanup_manager._count_old_logs() == len(expired)
+            results = cleanup_manager.cleanup_logs(verbose=True)
+
+        assert results["success"] is True
+        assert sorted(results["deleted_files"]) == sorted(str(logs_dir / name) for name in expired)
+        assert sorted(p.name for p in logs_dir.iterdir()) == ["cleanup.log", "notes.txt", "recent.log.2026-01-02"]
+
+    def test_cleanup_deletes_files(self, cleanup_manager):
+        """Test temp files and expired backups are deleted, with backup sidecars"""
+        root = cleanup_manager.project_root
+        temp_files = [root / "data" / f"file_{i}.tmp" for i in range(40)] + [root / "._notes.bak"]
+        for temp_file in temp_files:
+            temp_file.write_text("temp")
+        (root / "data" / "keep.txt").write_text("keep")
+
+        time_ago = (datetime.now() - timedelta(days=cleanup_manager.backup_retention_days + 1)).timestamp()
+        old_backup = root / "backups" / "local_backup_old.tar.gz"
+        old_backup.write_bytes(b"backup")
+        (root / "backups" / "local_backup_old.manifest.json").write_text("{}")
+        os.utime(old_backup, (time_ago, time_ago))
+        new_backup = root / "backups" / "local_backup_new.tar.gz"
+        new_backup.write_bytes(b"backup")
+
+        temp_results = cleanup_manager.cleanup_temp_files()
+        backup_results = cleanup_manager.cleanup_old_backups(verbose=True)
+
+        assert temp_results["deleted_count"] == len(temp_files)
+        assert temp_results["deleted_files"] == []
+        assert not any(temp_file.exists() for temp_file in temp_files)
+        assert (root / "data" / "keep.txt").exists()
+        assert backup_results["deleted_files"] == [str(old_backup)]
+        assert not (root / "backups" / "local_backup_old.manifest.json").exists()
+        assert new_backup.exists()
+
+    def test_cleanup_old_backups_keeps_incremental_chains(self, cleanup_manager):
+        """Test expired levels of a chain with an unexpired newer level are kept"""
+        backups = cleanup_manager.project_root / "backups"
+        time_ago = (datetime.now() - timedelta(days=cleanup_manager.backup_retention_days + 1)).timestamp()
+        chain = [("local_backup_a", 0, time_ago), ("local_backup_b", 1, time_ago), ("local_backup_c", 2, None)]
+        for name, level, mtime in chain:
+            archive = backups / f"{name}.tar.gz"
+            archive.write_bytes(b"backup")
+            (backups / f"{name}.manifest.json").write_text(
+                json.dumps({"incremental": {"level": level, "base": "local_backup_a"}})
+            )
+            if mtime:
+                os.utime(archive, (mtime, mtime))
+        old_full = backups / "local_backup_old.tar.gz"
+        old_full.write_bytes(b"backup")
+        os.utime(old_full, (time_ago, time_ago))
+
+        assert cleanup_manager._count_old_backups() == 1
+        results = cleanup_manager.cleanup_old_backups()
+
+        assert results["deleted_count"] == 1, results["errors"]
+        assert not old_full.exists()
+        assert all((backups / f"{name}.tar.gz").exists() for name, _, _ in chain)
+
+    def test_cleanup_temp_files_skips_unchanged_directories(self, cleanup_manager):
+        """Test temp file sweeps skip directories unmodified since a clean sweep"""
+        root = cleanup_manager.project_root
+        settled = time.time() - 60
+        for directory in ["data", "logs", "backups", "restore"]:
+            os.utime(root / directory, (settled, settled))
+        cleanup_manager.cleanup_temp_files()
+        os.utime(root, (settled, settled))
+        cleanup_manager.cleanup_temp_files()
+        assert (root / ".cache" / "cleanup-cache.json").exists()
+
+        with patch("scripts.cleanup.os.scandir", side_effect=AssertionError("rescanned")):
+            assert cleanup_manager.cleanup_temp_files()["success"] is True
+
+        (root / "data" / "new.tmp").write_text("temp")
+        results = cleanup_manager.cleanup_temp_files()
+        assert results["deleted_count"] == 1
+        assert not (root / "data" / "new.tmp").exists()
+
+    def test_cleanup_s3_batches_deletes(self, cleanup_manager):
+        """Test expired S3 objects are deleted with batched DeleteObjects calls"""
+        old = datetime.now(timezone.utc) - timedelta(days=cleanup_manager.backup_retention_days + 1)
+        new = datetime.now(timezone.utc)
+        contents = [{"Key": f"backups/old_{i}.tar.gz", "LastModified": old} for i in range(1500)]
+        contents.append({"Key": "backups/new.tar.gz", "LastModified": new})
+
+        with patch("boto3.Session") as mock_session:
+            s3 = mock_session.return_value.client.return_value
+            s3.get_paginator.return_value.paginate.return_value = [{"Contents": contents}]
+            denied = {"Key": "backups/old_1499.tar.gz", "Message": "Access Denied"}
+            s3.delete_objects.side_effect = lambda Bucket, Delete: (
+                {"Errors": [denied]} if {"Key": denied["Key"]} in Delete["Objects"] else {}
+            )
+            results = cleanup_manager.cleanup_s3("my-bucket", store_keys=True)
+
+        assert s3.get_paginator.return_value.paginate.call_args.kwargs["Prefix"] == "backups/"
+        batches = [call.kwargs["Delete"]["Objects"] for call in s3.delete_objects.call_args_list]
+        assert sorted(len(b) for b in batches) == [500, 1000]
+        assert not s3.delete_object.called
+        assert results["deleted_count"] == 1499
+        assert len(results["deleted_objects"]) == 1499
+        assert "backups/old_1499.tar.gz" not in results["deleted_objects"]
+        assert len(results["errors"]) == 1
+
+    def test_cleanup_s3_bounds_pending_batches(self, cleanup_manager):
+        """Test large S3 cleanups keep counts only and few batches in flight"""
+        old = datetime.now(timezone.utc) - timedelta(days=cleanup_manager.backup_retention_days + 1)
+        pages = [{"Contents": [{"Key": f"backups/{p}_{i}", "LastModified": old} for i in range(1000)]}
+                 for p in range(40)]
+
+        with patch("boto3.Session") as mock_session, \
+             patch("scripts.backup.wait", wraps=concurrent.futures.wait) as mock_wait:
+            s3 = mock_session.return_value.client.return_value
+            s3.get_paginator.return_value.paginate.return_value = pages
+            s3.delete_objects.return_value = {}
+            results = cleanup_manager.cleanup_s3("my-bucket")
+
+        assert results["deleted_count"] == 40000
+        assert results["deleted_objects"] == []
+        assert mock_wait.called
+
+    def test_s3_lifecycle_policy_delegates_cleanup(self, cleanup_manager):
+        """Test the lifecycle rule keeps other rules and replaces the S3 scan"""
+        other_rule = {"ID": "archive", "Status": "Enabled", "Filter": {"Prefix": "data/"}}
+
+        with patch("boto3.Session") as mock_session:
+            s3 = mock_session.return_value.client.return_value
+            s3.get_bucket_lifecycle_configuration.return_value = {"Rules": [other_rule]}
+            results = cleanup_manager.ensure_s3_lifecycle_policy("my-bucket")
+
+            rules = s3.put_bucket_lifecycle_configuration.call_args.kwargs["LifecycleConfiguration"]["Rules"]
+            s3.get_bucket_lifecycle_configuration.return_value = {"Rules": rules}
+            cleanup_results = cleanup_manager.cleanup_s3("my-bucket")
+
+        assert results["success"], results["errors"]
+        assert rules[0] == other_rule
+        assert rules[1]["Expiration"] == {"Days": cleanup_manager.backup_retention_days}
+        assert cleanup_results["lifecycle_delegated"]
+        assert not s3.get_paginator.called
+
     def test_cleanup_restore_directory(self, cleanup_manager):
         """Test restore directory cleanup"""
         # Create test file in restore directory
@@ -333,6 +777,23 @@ class TestCleanupManager:
         assert "deleted_files" in results
         assert "deleted_count" in results
         assert "errors" in results
+        assert test_file.exists()
+
+    def test_cleanup_restore_directory_removes_tree(self, cleanup_manager):
+        """Test restore cleanup empties nested trees and keeps the directory"""
+        restore_dir = cleanup_manager.project_root / "restore"
+        (restore_dir / "photos" / "2024").mkdir(parents=True)
+        (restore_dir / "photos" / "2024" / "a.jpg").write_bytes(b"jpg")
+        (restore_dir / "test.txt").write_text("test content")
+
+        results = cleanup_manager.cleanup_restore_directory(verbose=True)
+
+        assert results["success"] is True
+        assert results["errors"] == []
+        assert results["deleted_count"] == 2
+        assert sorted(results["deleted_files"]) == [str(restore_dir / "photos"), str(restore_dir / "test.txt")]
+        assert restore_dir.is_dir()
+        assert list(restore_dir.iterdir()) == []
     
     def test_cleanup_all(self, cleanup_manager):
         """Test all cleanup operations"""
@@ -364,6 +825,26 @@ class TestCleanupManager:
         assert isinstance(count, int)
         assert count >= 0
     
+    def test_cleanup_stats_reuse_cleanup_scans(self, cleanup_manager):
+        """Test stats reuse counts learned by cleanup and drop them after deletions"""
+        root = cleanup_manager.project_root
+        old_log = root / "logs" / "old.log"
+        old_log.write_text("log")
+        time_ago = (datetime.now() - timedelta(days=cleanup_manager.log_retention_days + 1)).timestamp()
+        os.utime(old_log, (time_ago, time_ago))
+        (root / "data" / "a.tmp").write_text("temp")
+
+        cleanup_manager.cleanup_logs(dry_run=True)
+        with patch("scripts.cleanup.os.scandir", side_effect=AssertionError("rescanned")):
+            assert cleanup_manager._count_old_logs() == 1
+
+        cleanup_manager.cleanup_logs()
+        assert cleanup_manager._count_old_logs() == 0
+
+        assert cleanup_manager._count_temp_files() == 1
+        cleanup_manager.cleanup_temp_files()
+        assert cleanup_manager._count_temp_files() == 0
+
     def test_count_old_backups(self, cleanup_manager):
         """Test old backup counting"""
         count = cleanup_manager._count_old_backups()